@@ -3,9 +3,10 @@ Application settings loaded from environment variables.
 
 Uses pydantic-settings for automatic loading from .env file.
 All settings have sensible defaults for production mode.
+The model is frozen: settings are parsed once and only read afterwards.
 """
 
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
@@ -33,6 +34,17 @@ class Settings(BaseSettings):
         claude_api_key: Claude API key (optional in mock mode)
         openrouter_api_key: OpenRouter API key for LLM (optional in mock mode)
         llm_model: LLM model to use via OpenRouter
+        max_concurrent_updates: Maximum number of updates processed at once
+        polling_timeout: Long-polling timeout for getUpdates, in seconds
+        token_data_cache_ttl: How long fetched token data is reused, in seconds
+        http_pool_max_connections: Connection limit of the shared HTTP session
+        http_pool_max_per_host: Per-host connection limit of the shared session
+        use_webhook: Receive updates via webhook instead of long polling
+        webhook_url: Public HTTPS URL registered with Telegram
+        webhook_path: Local path the webhook handler listens on
+        webhook_secret: Secret token Telegram sends with each update
+        webhook_host: Interface for the webhook HTTP server
+        webhook_port: Port for the webhook HTTP server
     """
 
     # Required
@@ -57,6 +69,27 @@ class Settings(BaseSettings):
     openrouter_api_key: str = ""
     llm_model: str = "anthropic/claude-3.5-sonnet"
 
+    # Update processing
+    max_concurrent_updates: int = 32
+    polling_timeout: int = 30
+
+    # Shared HTTP connection pool (Helius + OpenRouter). Sized above
+    # max_concurrent_updates so bursts reuse open connections instead of
+    # waiting for a free slot or opening new TLS connections
+    http_pool_max_connections: int = 100
+    http_pool_max_per_host: int = 50
+
+    # Caching
+    token_data_cache_ttl: float = 60.0
+
+    # Webhook mode (long polling is used when disabled)
+    use_webhook: bool = False
+    webhook_url: str = ""
+    webhook_path: str = "/webhook"
+    webhook_secret: str = ""
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8080
+
     # Pydantic settings config
     model_config = SettingsConfigDict(
         env_file=PROJECT_ROOT / ".env",  # Absolute path to .env
@@ -65,28 +98,37 @@ class Settings(BaseSettings):
         case_sensitive=False,
         # Don't fail if .env doesn't exist
         env_ignore_empty=True,
+        # Settings are read-only after load
+        frozen=True,
     )
 
-    @property
+    # Environment is immutable, so the flags are computed once per instance
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.environment == "production"
 
 
-@lru_cache
+# Process-wide settings instance, populated on first get_settings() call
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
     """
-    Get cached application settings.
+    Get application settings.
 
-    Uses lru_cache to avoid re-reading .env file on every call.
-    Settings are loaded once and reused throughout the application.
+    Settings are loaded from the environment once and stored in a
+    module-level singleton, so repeated calls are a plain global lookup.
 
     Returns:
         Settings instance with all configuration values.
     """
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
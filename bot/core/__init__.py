@@ -5,23 +5,53 @@ This module contains the fundamental building blocks of the application:
 - Data models (Pydantic)
 - Protocol definitions (interfaces)
 - Custom exceptions
+
+Re-exports are resolved lazily (PEP 562), so importing one submodule
+such as bot.core.models does not pull in the others.
 """
 
-from bot.core.exceptions import (
-    DataFetchError,
-    LLMError,
-    TokenBrainError,
-    ValidationError,
-)
-from bot.core.models import (
-    AnalysisResult,
-    Recommendation,
-    RiskLevel,
-    RugpullFlags,
-    SocialInfo,
-    TokenData,
-)
-from bot.core.protocols import LLMProvider, TokenDataProvider
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bot.core.exceptions import (
+        DataFetchError,
+        LLMError,
+        TokenBrainError,
+        ValidationError,
+    )
+    from bot.core.models import (
+        AnalysisResult,
+        Recommendation,
+        RiskLevel,
+        RugpullFlag,
+        RugpullFlags,
+        SocialFlag,
+        SocialInfo,
+        TokenData,
+    )
+    from bot.core.protocols import LLMProvider, TokenDataProvider
+
+# Exported name -> defining module
+_LAZY_EXPORTS = {
+    # Exceptions
+    "TokenBrainError": "bot.core.exceptions",
+    "ValidationError": "bot.core.exceptions",
+    "DataFetchError": "bot.core.exceptions",
+    "LLMError": "bot.core.exceptions",
+    # Models
+    "RiskLevel": "bot.core.models",
+    "Recommendation": "bot.core.models",
+    "RugpullFlag": "bot.core.models",
+    "RugpullFlags": "bot.core.models",
+    "SocialFlag": "bot.core.models",
+    "SocialInfo": "bot.core.models",
+    "TokenData": "bot.core.models",
+    "AnalysisResult": "bot.core.models",
+    # Protocols
+    "TokenDataProvider": "bot.core.protocols",
+    "LLMProvider": "bot.core.protocols",
+}
 
 __all__ = [
     # Exceptions
@@ -32,7 +62,9 @@ __all__ = [
     # Models
     "RiskLevel",
     "Recommendation",
+    "RugpullFlag",
     "RugpullFlags",
+    "SocialFlag",
     "SocialInfo",
     "TokenData",
     "AnalysisResult",
@@ -40,3 +72,18 @@ __all__ = [
     "TokenDataProvider",
     "LLMProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access and cache it in the module."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
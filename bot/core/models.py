@@ -8,17 +8,27 @@ Models provide:
 - JSON serialization/deserialization
 """
 
-from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field
-
-
-class RiskLevel(str, Enum):
+from collections.abc import Mapping
+from enum import IntFlag, StrEnum
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+)
+
+
+class RiskLevel(StrEnum):
     """
     Token risk level.
 
     Values match the LLM output format exactly.
+    Members are singletons, so hot paths may compare with ``is``.
     """
 
     HIGH = "high"
@@ -26,7 +36,7 @@ class RiskLevel(str, Enum):
     LOW = "low"
 
 
-class Recommendation(str, Enum):
+class Recommendation(StrEnum):
     """
     Trading recommendation based on risk analysis.
 
@@ -38,6 +48,23 @@ class Recommendation(str, Enum):
     OK = "ok"
 
 
+class RugpullFlag(IntFlag):
+    """Bit flags mirroring RugpullFlags fields (see RugpullFlags.flags)."""
+
+    NEW_CONTRACT = 1
+    LOW_LIQUIDITY = 2
+    CENTRALIZED_HOLDERS = 4
+    DEVELOPER_WALLET_MOVES = 8
+
+
+class SocialFlag(IntFlag):
+    """Bit flags mirroring SocialInfo fields (see SocialInfo.flags)."""
+
+    TWITTER = 1
+    TELEGRAM = 2
+    WEBSITE = 4
+
+
 class RugpullFlags(BaseModel):
     """
     Flags indicating potential rugpull risks.
@@ -58,6 +85,18 @@ class RugpullFlags(BaseModel):
     developer_wallet_moves: bool = False
     """Suspicious activity from developer wallets"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @cached_property
+    def flags(self) -> RugpullFlag:
+        """All flags packed into a single bitmask."""
+        return RugpullFlag(
+            (RugpullFlag.NEW_CONTRACT if self.new_contract else 0)
+            | (RugpullFlag.LOW_LIQUIDITY if self.low_liquidity else 0)
+            | (RugpullFlag.CENTRALIZED_HOLDERS if self.centralized_holders else 0)
+            | (RugpullFlag.DEVELOPER_WALLET_MOVES if self.developer_wallet_moves else 0)
+        )
+
 
 class SocialInfo(BaseModel):
     """
@@ -76,6 +115,17 @@ class SocialInfo(BaseModel):
     website_valid: bool = False
     """Has a working website"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @cached_property
+    def flags(self) -> SocialFlag:
+        """Present social channels packed into a single bitmask."""
+        return SocialFlag(
+            (SocialFlag.TWITTER if self.twitter_exists else 0)
+            | (SocialFlag.TELEGRAM if self.telegram_exists else 0)
+            | (SocialFlag.WEBSITE if self.website_valid else 0)
+        )
+
 
 class TokenData(BaseModel):
     """
@@ -141,7 +191,8 @@ class TokenData(BaseModel):
     social: SocialInfo = Field(default_factory=SocialInfo)
     """Social media presence"""
 
-    model_config = {"from_attributes": True}
+    # Not frozen: callers may adjust fields after construction
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 
 class AnalysisResult(BaseModel):
@@ -172,8 +223,10 @@ class AnalysisResult(BaseModel):
     recommendation: Recommendation
     """Action recommendation: avoid | caution | ok"""
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "risk": "high",
                 "summary": "Токен выглядит очень рискованным: "
@@ -186,8 +239,8 @@ class AnalysisResult(BaseModel):
                 ],
                 "recommendation": "avoid",
             }
-        }
-    }
+        },
+    )
 
 
 class RiskResult(BaseModel):
@@ -213,19 +266,56 @@ class RiskResult(BaseModel):
     context_completeness: float = Field(ge=0.0, le=1.0)
     """Completeness of contextual signals (age, liquidity, metadata). 1.0 = all known."""
 
-    risk_signals: dict[str, Any]
-    """Raw risk signals for LLM (null = unknown)"""
+    risk_signals: Mapping[str, Any]
+    """Raw risk signals for LLM (null = unknown). Read-only."""
 
-    factors: list[str]
+    factors: tuple[str, ...]
     """Human-readable risk factors. LLM must use ONLY these, not add new ones."""
 
-    @property
+    @field_validator("risk_signals", mode="after")
+    @classmethod
+    def _freeze_signals(cls, value: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Wrap signals read-only: results are shared between callers.
+
+        Validation has already built a fresh dict, so it is wrapped as is.
+        """
+        return MappingProxyType(value)
+
+    @field_serializer("risk_signals")
+    def _serialize_signals(self, value: Mapping[str, Any]) -> dict[str, Any]:
+        """Serialize the read-only signals view as a plain dict."""
+        return dict(value)
+
+    def __hash__(self) -> int:
+        """Hash by content; the signals view is hashed as its items."""
+        return hash(
+            (
+                self.level,
+                self.safety_completeness,
+                self.context_completeness,
+                frozenset(self.risk_signals.items()),
+                self.factors,
+            )
+        )
+
+    @cached_property
     def total_completeness(self) -> float:
         """
         Combined completeness score.
 
         Safety is weighted 70%, context 30%.
+        Computed on first access and cached on the instance
+        (model_copy drops the cached value, see below).
         """
         return (self.safety_completeness * 0.7) + (self.context_completeness * 0.3)
 
-    model_config = {"from_attributes": True}
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model without cached properties, which may be stale."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("total_completeness", None)
+        return copied
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
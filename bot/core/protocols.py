@@ -7,15 +7,17 @@ Using typing.Protocol instead of ABC because:
 3. Better for dependency injection
 4. Easier to mock in tests
 
+Protocols are static-only (not runtime_checkable): services are wired
+through ServiceFactory, and nothing checks them with isinstance().
+
 Each protocol defines the contract that implementations must follow.
 """
 
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 from bot.core.models import AnalysisResult, RiskResult, TokenData
 
 
-@runtime_checkable
 class TokenDataProvider(Protocol):
     """
     Protocol for token data providers.
@@ -44,7 +46,6 @@ class TokenDataProvider(Protocol):
         ...
 
 
-@runtime_checkable
 class LLMProvider(Protocol):
     """
     Protocol for LLM providers.
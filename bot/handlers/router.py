@@ -8,36 +8,47 @@ Order matters - command handlers are registered before catch-all.
 from aiogram import Dispatcher
 
 from bot.handlers import common_handler, token_handler
-from bot.middleware import ErrorHandlerMiddleware, LoggingMiddleware
+from bot.middleware import (
+    ConcurrencyLimitMiddleware,
+    ErrorHandlerMiddleware,
+    LoggingMiddleware,
+)
 from bot.services.orchestrator import AnalyzerOrchestrator
 
 
 def setup_routers(
     dp: Dispatcher,
     orchestrator: AnalyzerOrchestrator,
+    max_concurrent_updates: int = 32,
 ) -> None:
     """
     Configure dispatcher with all routers and middleware.
 
     Sets up:
-    1. Global middleware (error handling, logging)
-    2. Command handlers (/start, /help)
-    3. Token analysis handler (catch-all)
+    1. Global concurrency limit for update processing
+    2. Token router middleware (error handling, logging)
+    3. Command handlers (/start, /help)
+    4. Token analysis handler (catch-all)
 
     Order is important:
-    - Middleware is processed for all updates
+    - Middleware only wraps token router handlers; /start and /help
+      are static replies and skip the chain entirely
     - Command handlers are checked first
     - Token handler catches remaining messages
 
     Args:
         dp: Aiogram dispatcher
         orchestrator: Analyzer service for injection into handlers
+        max_concurrent_updates: Maximum number of updates processed at once
     """
+    # Bound in-flight updates: each one runs as its own task
+    dp.update.middleware(ConcurrencyLimitMiddleware(max_concurrent_updates))
+
     # Register middleware (order: first registered = outermost)
     # Logging should be outermost to capture all requests including errors
     # Error handler is inner to catch and transform exceptions
-    dp.update.middleware(LoggingMiddleware())
-    dp.update.middleware(ErrorHandlerMiddleware())
+    token_handler.router.message.middleware(LoggingMiddleware())
+    token_handler.router.message.middleware(ErrorHandlerMiddleware())
 
     # Store orchestrator for dependency injection
     # This makes it available as a handler argument
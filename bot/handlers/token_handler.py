@@ -3,15 +3,18 @@ Token analysis handler.
 
 Handles messages containing Solana token addresses.
 Main workflow:
-1. Sanitize input
-2. Validate address format
+1. Strip input
+2. Validate address format (base58 alphabet rejects unsafe characters)
 3. Call orchestrator for analysis
 4. Format and send result
 """
 
+import asyncio
 import logging
+from collections.abc import Coroutine
+from typing import Any
 
-from aiogram import Router
+from aiogram import F, Router
 from aiogram.enums import ChatAction
 from aiogram.types import Message
 
@@ -24,11 +27,24 @@ logger = logging.getLogger(__name__)
 
 router = Router(name="token")
 
-# Maximum reasonable input length (Solana address is 32-44 chars)
-MAX_INPUT_LENGTH = 100
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
 
 
-@router.message()
+def _run_in_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Schedule a coroutine without awaiting it; failures are only logged."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background task failed: %r", task.exception())
+
+
+@router.message(F.text)
 async def handle_message(
     message: Message,
     orchestrator: AnalyzerOrchestrator,
@@ -36,7 +52,7 @@ async def handle_message(
     """
     Handle any text message as potential token address.
 
-    This is a catch-all handler for messages that don't match
+    This is a catch-all handler for text messages that don't match
     any commands. It tries to interpret the message as a
     Solana token address.
 
@@ -44,35 +60,26 @@ async def handle_message(
         message: Incoming Telegram message
         orchestrator: Injected analyzer orchestrator
     """
-    # Ignore non-text messages
-    if not message.text:
-        await message.answer(INVALID_ADDRESS)
-        return
-
-    # Extract and sanitize the input
-    raw_input = message.text.strip()
-
-    # Check length before processing
-    if len(raw_input) > MAX_INPUT_LENGTH:
-        logger.debug(f"Input too long: {len(raw_input)} chars")
-        await message.answer(INVALID_ADDRESS)
-        return
-
-    # Remove non-printable characters (security)
-    address = "".join(c for c in raw_input if c.isprintable())
+    # Extract the input
+    address = message.text.strip()
 
     # Validate Solana address format
+    # Enforces the 32-44 length bound; the base58 alphabet check also
+    # rejects control/non-printable characters
     is_valid, error = validate_solana_address(address)
 
     if not is_valid:
-        logger.debug(f"Invalid address: {error}")
+        logger.debug("Invalid address: %s", error)
         await message.answer(INVALID_ADDRESS)
         return
 
     # Show typing indicator while analyzing
-    await message.bot.send_chat_action(
-        chat_id=message.chat.id,
-        action=ChatAction.TYPING,
+    # Sent concurrently with the analysis instead of blocking on its round-trip
+    _run_in_background(
+        message.bot.send_chat_action(
+            chat_id=message.chat.id,
+            action=ChatAction.TYPING,
+        )
     )
 
     # Perform analysis
@@ -82,3 +89,17 @@ async def handle_message(
     # Format and send result
     formatted = format_analysis_result(result)
     await message.answer(formatted)
+
+
+@router.message()
+async def handle_non_text(message: Message) -> None:
+    """
+    Reply to non-text messages (photos, stickers, etc.).
+
+    Registered after handle_message, so the F.text filter routes text
+    there and only the remaining messages reach this handler.
+
+    Args:
+        message: Incoming Telegram message
+    """
+    await message.answer(INVALID_ADDRESS)
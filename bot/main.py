@@ -8,36 +8,122 @@ Run with: python -m bot.main
 """
 
 import asyncio
+import contextlib
 import logging
+import logging.handlers
+import queue
+import signal
 import sys
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
 
 from bot.config import get_settings
 from bot.handlers import setup_routers
 from bot.services.factory import ServiceFactory
 
+# Log line format, built once at import
+_LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-def setup_logging(level: str) -> None:
+# Signals that stop the webhook server gracefully
+_STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+def setup_logging(level: str) -> logging.handlers.QueueListener:
     """
     Configure application logging.
 
+    Records are put on a queue by the root logger and written to stdout
+    by a background listener thread, so handlers never block the event
+    loop on I/O.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
+
+    Returns:
+        Started queue listener; call stop() on exit to flush pending records
     """
-    logging.basicConfig(
-        level=getattr(logging, level),
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout,
+    # The format uses none of these, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_LOG_FORMATTER)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    listener.start()
 
     # Reduce noise from external libraries
     logging.getLogger("aiogram").setLevel(logging.WARNING)
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
+    return listener
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot, settings) -> None:
+    """
+    Serve updates pushed by Telegram until SIGTERM or SIGINT.
+
+    Registers the webhook, starts an aiohttp server on the configured
+    host/port and removes the webhook again on exit. Cleaning up the
+    runner emits the dispatcher's shutdown (see setup_application).
+    """
+    # The process blocks here instead of in start_polling, so handle the
+    # stop signals ourselves (docker stop sends SIGTERM to PID 1)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in _STOP_SIGNALS:
+        with contextlib.suppress(NotImplementedError):  # Windows
+            loop.add_signal_handler(sig, stop.set)
+
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        handle_in_background=True,
+        secret_token=settings.webhook_secret or None,
+    ).register(app, path=settings.webhook_path)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    try:
+        await bot.set_webhook(
+            settings.webhook_url,
+            allowed_updates=dp.resolve_used_update_types(),
+            secret_token=settings.webhook_secret or None,
+        )
+
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, settings.webhook_host, settings.webhook_port)
+            await site.start()
+            await stop.wait()
+        finally:
+            # Cleanup must run even if removing the webhook fails
+            try:
+                await bot.delete_webhook()
+            finally:
+                await runner.cleanup()
+    finally:
+        for sig in _STOP_SIGNALS:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(sig)
+
 
 def validate_production_config(settings) -> None:
     """
@@ -46,6 +132,9 @@ def validate_production_config(settings) -> None:
     Raises:
         RuntimeError: If required env vars are missing.
     """
+    if settings.use_webhook and not settings.webhook_url:
+        raise RuntimeError("USE_WEBHOOK=true requires WEBHOOK_URL to be set.")
+
     if settings.use_mock_services:
         return  # Mock mode doesn't need real API keys
 
@@ -73,66 +162,99 @@ async def main() -> None:
     4. Bot and dispatcher
     5. Handlers and middleware
 
-    Then starts polling for updates.
+    Then starts polling for updates, or serves a webhook if enabled.
     """
     # Load configuration
     settings = get_settings()
 
     # Setup logging first (so validation errors are logged)
-    setup_logging(settings.log_level)
-
-    # Validate production config
-    validate_production_config(settings)
+    log_listener = setup_logging(settings.log_level)
     logger = logging.getLogger(__name__)
 
-    logger.info("=" * 50)
-    logger.info("TokenBrain Bot starting...")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Mock mode: {settings.use_mock_services}")
-    logger.info("=" * 50)
-
-    # Create services
-    factory = ServiceFactory(settings)
-    orchestrator = factory.create_orchestrator()
-
-    # Initialize bot
-    bot = Bot(
-        token=settings.telegram_bot_token,
-        default=DefaultBotProperties(
-            parse_mode=ParseMode.HTML,
-        ),
-    )
+    # Everything after logging setup is guarded, so startup errors are
+    # logged and flushed too
+    try:
+        # Validate production config
+        validate_production_config(settings)
 
-    # Initialize dispatcher
-    dp = Dispatcher()
+        logger.info("=" * 50)
+        logger.info("TokenBrain Bot starting...")
+        logger.info("Environment: %s", settings.environment)
+        logger.info("Mock mode: %s", settings.use_mock_services)
+        logger.info("=" * 50)
 
-    # Setup handlers and middleware
-    setup_routers(dp, orchestrator)
+        # Create services
+        factory = ServiceFactory(settings)
+        # The factory owns the HTTP session: close it however startup or
+        # polling ends (close() is a no-op once on_shutdown has run)
+        try:
+            orchestrator = factory.create_orchestrator()
+            await factory.warmup()
 
-    # Graceful shutdown handler
-    async def on_shutdown() -> None:
-        logger.info("Shutting down...")
-        await bot.session.close()
+            # Initialize bot
+            bot = Bot(
+                token=settings.telegram_bot_token,
+                default=DefaultBotProperties(
+                    parse_mode=ParseMode.HTML,
+                ),
+            )
 
-    dp.shutdown.register(on_shutdown)
+            # Initialize dispatcher
+            dp = Dispatcher()
 
-    # Start polling
-    logger.info("Bot is ready. Starting polling...")
+            # Setup handlers and middleware
+            setup_routers(
+                dp,
+                orchestrator,
+                max_concurrent_updates=settings.max_concurrent_updates,
+            )
 
-    try:
-        await dp.start_polling(
-            bot,
-            allowed_updates=dp.resolve_used_update_types(),
-        )
-    except Exception as e:
-        logger.exception(f"Bot stopped with error: {e}")
+            # Graceful shutdown handler
+            async def on_shutdown() -> None:
+                logger.info("Shutting down...")
+                await orchestrator.shutdown()
+                await factory.close()
+                await bot.session.close()
+
+            dp.shutdown.register(on_shutdown)
+
+            if settings.use_webhook:
+                logger.info("Bot is ready. Serving webhook...")
+                await run_webhook(dp, bot, settings)
+            else:
+                logger.info("Bot is ready. Starting polling...")
+                # Each update runs as its own task, so slow analyses (LLM calls)
+                # don't hold up the next getUpdates request
+                await dp.start_polling(
+                    bot,
+                    allowed_updates=dp.resolve_used_update_types(),
+                    handle_as_tasks=True,
+                    # Longer long-poll: fewer empty getUpdates round-trips when idle
+                    polling_timeout=settings.polling_timeout,
+                )
+        finally:
+            await factory.close()
+    except Exception:
+        logger.exception("Bot stopped with error")
         raise
     finally:
         logger.info("Bot stopped.")
+        # Flush queued records after the last log line
+        log_listener.stop()
 
 
-if __name__ == "__main__":
+def run() -> None:
+    """Run main() on uvloop when it is installed, else on the default loop."""
     try:
+        import uvloop
+    except ImportError:
         asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
+if __name__ == "__main__":
+    try:
+        run()
     except KeyboardInterrupt:
         print("\nBot stopped by user.")
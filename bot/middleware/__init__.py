@@ -1,6 +1,7 @@
 """Middleware for aiogram."""
 
+from bot.middleware.concurrency import ConcurrencyLimitMiddleware
 from bot.middleware.error_handler import ErrorHandlerMiddleware
 from bot.middleware.logging import LoggingMiddleware
 
-__all__ = ["ErrorHandlerMiddleware", "LoggingMiddleware"]
+__all__ = ["ConcurrencyLimitMiddleware", "ErrorHandlerMiddleware", "LoggingMiddleware"]
@@ -0,0 +1,63 @@
+"""
+Concurrency limiting middleware for aiogram.
+
+Updates are dispatched as independent tasks, so a slow upstream
+(e.g. LLM outage) could otherwise let an unbounded number of
+in-flight analyses pile up. This middleware caps how many updates
+are processed at once; the rest wait for a free slot.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    """
+    Middleware that bounds the number of updates handled concurrently.
+
+    Each update acquires a shared semaphore slot before reaching the
+    handlers and releases it when processing finishes.
+
+    Usage:
+        dp.update.middleware(ConcurrencyLimitMiddleware(limit=32))
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            limit: Maximum number of updates processed at once
+        """
+        super().__init__()
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        """
+        Process update once a concurrency slot is free.
+
+        Args:
+            handler: Next handler in chain
+            event: Incoming update
+            data: Handler data
+
+        Returns:
+            Handler result
+        """
+        if self._semaphore.locked():
+            logger.debug("Concurrency limit reached, update is waiting")
+
+        async with self._semaphore:
+            return await handler(event, data)
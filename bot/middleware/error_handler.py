@@ -16,7 +16,7 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 from aiogram import BaseMiddleware
-from aiogram.types import Message, Update
+from aiogram.types import Message, TelegramObject
 
 from bot.core.exceptions import (
     DataFetchError,
@@ -45,14 +45,33 @@ class ErrorHandlerMiddleware(BaseMiddleware):
     All TokenBrainError subclasses have predefined user messages.
     Unknown errors get a generic "something went wrong" message.
 
+    Works with both Update events and Message events, so it can be
+    installed on the dispatcher or scoped to a single router.
+
     Usage:
-        dp.update.middleware(ErrorHandlerMiddleware())
+        router.message.middleware(ErrorHandlerMiddleware())
     """
 
+    # Error type -> (fallback message, log level); subclasses inherit
+    # the policy of their nearest listed base
+    _POLICY: dict[type[TokenBrainError], tuple[str | None, str]] = {
+        ValidationError: (None, "warning"),
+        DataFetchError: (ERROR_TRY_LATER, "error"),
+        LLMError: (ERROR_SERVICE_UNAVAILABLE, "error"),
+    }
+
+    # Policy for TokenBrainError subclasses not covered above
+    _DEFAULT_POLICY: tuple[str | None, str] = (None, "error")
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Resolved policy per concrete error type, filled on first occurrence
+        self._policy_cache: dict[type[TokenBrainError], tuple[str | None, str]] = {}
+
     async def __call__(
         self,
-        handler: Callable[[Update, dict[str, Any]], Awaitable[Any]],
-        event: Update,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
         """
@@ -60,7 +79,7 @@ class ErrorHandlerMiddleware(BaseMiddleware):
 
         Args:
             handler: Next handler in chain
-            event: Incoming update
+            event: Incoming update or message
             data: Handler data
 
         Returns:
@@ -69,40 +88,48 @@ class ErrorHandlerMiddleware(BaseMiddleware):
         try:
             return await handler(event, data)
 
-        except ValidationError as e:
-            await self._handle_error(event, e, log_level="warning")
-
-        except DataFetchError as e:
-            await self._handle_error(
-                event,
-                e,
-                fallback_message=ERROR_TRY_LATER,
-                log_level="error",
-            )
-
-        except LLMError as e:
+        except TokenBrainError as e:
+            error_type = type(e)
+            fallback_message, log_level = self._policy_for(error_type)
             await self._handle_error(
-                event,
+                self._reply_target(event),
                 e,
-                fallback_message=ERROR_SERVICE_UNAVAILABLE,
-                log_level="error",
+                error_name=error_type.__name__,
+                fallback_message=fallback_message,
+                log_level=log_level,
             )
 
-        except TokenBrainError as e:
-            # Catch-all for our custom exceptions
-            await self._handle_error(event, e, log_level="error")
-
         except Exception as e:
-            # Unknown errors - log full traceback
-            logger.exception(f"Unexpected error: {type(e).__name__}: {e}")
-            await self._send_error_message(event, ERROR_GENERIC)
+            # Unknown errors - log full traceback (it carries the message)
+            logger.exception("Unexpected error: %s", type(e).__name__)
+            await self._send_error_message(self._reply_target(event), ERROR_GENERIC)
 
         return None
 
+    def _policy_for(
+        self,
+        error_type: type[TokenBrainError],
+    ) -> tuple[str | None, str]:
+        """Find the policy of the nearest listed base class of error_type."""
+        policy = self._policy_cache.get(error_type)
+        if policy is not None:
+            return policy
+
+        for cls in error_type.__mro__:
+            policy = self._POLICY.get(cls)
+            if policy is not None:
+                break
+        else:
+            policy = self._DEFAULT_POLICY
+
+        self._policy_cache[error_type] = policy
+        return policy
+
     async def _handle_error(
         self,
-        event: Update,
+        reply_target: Message | None,
         error: TokenBrainError,
+        error_name: str,
         fallback_message: str | None = None,
         log_level: str = "error",
     ) -> None:
@@ -110,43 +137,52 @@ class ErrorHandlerMiddleware(BaseMiddleware):
         Handle a known error type.
 
         Args:
-            event: The update that caused the error
+            reply_target: Message to answer, if any
             error: The exception that was raised
+            error_name: Class name of the exception, for logging
             fallback_message: Message to use if error.message is empty
             log_level: Logging level (warning, error)
         """
         # Log technical details
         log_func = getattr(logger, log_level)
-        log_func(f"{type(error).__name__}: {error.technical_message}")
+        log_func("%s: %s", error_name, error.technical_message)
 
         # Send user-friendly message
         message = error.message or fallback_message or ERROR_GENERIC
-        await self._send_error_message(event, message)
+        await self._send_error_message(reply_target, message)
+
+    @staticmethod
+    def _reply_target(event: TelegramObject) -> Message | None:
+        """
+        Get the message to answer for an event.
+
+        Only resolved once an error occurred, so successful updates
+        never walk the Update object.
+        """
+        if isinstance(event, Message):
+            return event
+        if event.message:
+            return event.message
+        if event.callback_query and event.callback_query.message:
+            return event.callback_query.message
+        return None
 
     async def _send_error_message(
         self,
-        event: Update,
+        reply_target: Message | None,
         message: str,
     ) -> None:
         """
         Send error message to user.
 
-        Extracts the message object from update and sends the error.
-
         Args:
-            event: The update to respond to
+            reply_target: Message to answer; nothing is sent when None
             message: Error message to send
         """
-        # Get the message object to reply to
-        msg: Message | None = None
+        if reply_target is None:
+            return
 
-        if event.message:
-            msg = event.message
-        elif event.callback_query and event.callback_query.message:
-            msg = event.callback_query.message
-
-        if msg:
-            try:
-                await msg.answer(message)
-            except Exception as e:
-                logger.error(f"Failed to send error message: {e}")
+        try:
+            await reply_target.answer(message)
+        except Exception as e:
+            logger.error("Failed to send error message: %s", e)
@@ -8,14 +8,22 @@ Captures user info, message content, and processing time.
 import logging
 import time
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import Any, NamedTuple
 
 from aiogram import BaseMiddleware
-from aiogram.types import Update
+from aiogram.types import Message, TelegramObject
 
 logger = logging.getLogger(__name__)
 
 
+class UpdateInfo(NamedTuple):
+    """User and content summary of an incoming update."""
+
+    user_id: int | str
+    username: str
+    payload: str
+
+
 class LoggingMiddleware(BaseMiddleware):
     """
     Middleware that logs all incoming updates.
@@ -25,16 +33,19 @@ class LoggingMiddleware(BaseMiddleware):
     - Message text (truncated for long messages)
     - Processing time
 
+    Works with both Update events and Message events, so it can be
+    installed on the dispatcher or scoped to a single router.
+
     Usage:
-        dp.update.middleware(LoggingMiddleware())
+        router.message.middleware(LoggingMiddleware())
     """
 
     MAX_TEXT_LENGTH = 100  # Truncate long messages in logs
 
     async def __call__(
         self,
-        handler: Callable[[Update, dict[str, Any]], Awaitable[Any]],
-        event: Update,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
         """
@@ -42,58 +53,67 @@ class LoggingMiddleware(BaseMiddleware):
 
         Args:
             handler: Next handler in chain
-            event: Incoming update
+            event: Incoming update or message
             data: Handler data
 
         Returns:
             Handler result
         """
-        start_time = time.monotonic()
-
-        # Extract user info
-        user_info = self._get_user_info(event)
-        message_info = self._get_message_info(event)
-
-        logger.info(f"Incoming: {user_info} | {message_info}")
+        # Skip extraction and timing entirely when the records would be dropped
+        if logger.isEnabledFor(logging.INFO):
+            # Extract user and message info in a single pass
+            info = self._extract(event)
+            logger.info(
+                "Incoming: user=%s (%s) | %s",
+                info.user_id,
+                info.username,
+                info.payload,
+            )
+
+        start_time = time.monotonic() if logger.isEnabledFor(logging.DEBUG) else None
 
         try:
             result = await handler(event, data)
 
-            # Calculate processing time
-            elapsed = (time.monotonic() - start_time) * 1000  # ms
-            logger.debug(f"Processed in {elapsed:.2f}ms")
+            if start_time is not None:
+                elapsed = (time.monotonic() - start_time) * 1000  # ms
+                logger.debug("Processed in %.2fms", elapsed)
 
             return result
 
         except Exception as e:
-            elapsed = (time.monotonic() - start_time) * 1000
-            logger.error(f"Error after {elapsed:.2f}ms: {type(e).__name__}: {e}")
+            if start_time is not None:
+                elapsed = (time.monotonic() - start_time) * 1000
+                logger.error("Error after %.2fms: %s: %s", elapsed, type(e).__name__, e)
+            else:
+                logger.error("Error: %s: %s", type(e).__name__, e)
             raise
 
-    def _get_user_info(self, event: Update) -> str:
-        """Extract user info from update."""
-        user = None
-
-        if event.message:
-            user = event.message.from_user
-        elif event.callback_query:
-            user = event.callback_query.from_user
+    def _extract(self, event: TelegramObject) -> UpdateInfo:
+        """Extract user and message info from update or message."""
+        if isinstance(event, Message):
+            msg, cq = event, None
+        else:
+            msg, cq = event.message, event.callback_query
 
-        if user:
-            username = f"@{user.username}" if user.username else "no_username"
-            return f"user={user.id} ({username})"
-
-        return "user=unknown"
+        user = None
+        if msg:
+            user = msg.from_user
+        elif cq:
+            user = cq.from_user
 
-    def _get_message_info(self, event: Update) -> str:
-        """Extract message info from update."""
-        if event.message and event.message.text:
-            text = event.message.text
+        if msg and msg.text:
+            text = msg.text
             if len(text) > self.MAX_TEXT_LENGTH:
                 text = text[: self.MAX_TEXT_LENGTH] + "..."
-            return f'text="{text}"'
+            payload = f'text="{text}"'
+        elif cq:
+            payload = f"callback={cq.data}"
+        else:
+            payload = "type=other"
 
-        if event.callback_query:
-            return f"callback={event.callback_query.data}"
+        if user is None:
+            return UpdateInfo("unknown", "no_username", payload)
 
-        return "type=other"
+        username = f"@{user.username}" if user.username else "no_username"
+        return UpdateInfo(user.id, username, payload)
@@ -13,6 +13,8 @@ Output format (must match exactly):
 }
 """
 
+from types import MappingProxyType
+
 from bot.core.models import (
     AnalysisResult,
     Recommendation,
@@ -21,6 +23,37 @@ from bot.core.models import (
     TokenData,
 )
 
+# Lookup tables are read-only views so they can't be mutated at runtime
+# Recommendation per risk level
+_REC_BY_LEVEL = MappingProxyType(
+    {
+        RiskLevel.HIGH: Recommendation.AVOID,
+        RiskLevel.MEDIUM: Recommendation.CAUTION,
+        RiskLevel.LOW: Recommendation.OK,
+    }
+)
+
+# Reasons used when RiskResult has no factors
+_DEFAULT_REASONS = MappingProxyType(
+    {
+        RiskLevel.HIGH: ("Обнаружены критические проблемы",),
+        RiskLevel.MEDIUM: ("Недостаточно данных для полного анализа",),
+        RiskLevel.LOW: ("Основные показатели в норме",),
+    }
+)
+
+# Summary template per risk level; {symbol} is the only per-token value
+_SUMMARY_TEMPLATES = MappingProxyType(
+    {
+        RiskLevel.HIGH: "{symbol}: высокий риск. Обнаружены критические проблемы.",
+        RiskLevel.MEDIUM: "{symbol}: средний риск. Требуется осторожность.",
+        RiskLevel.LOW: "{symbol}: низкий риск. Основные показатели в норме.",
+    }
+)
+
+# Appended to the summary when safety data is incomplete
+_COMPLETENESS_NOTE = " Часть данных недоступна."
+
 
 class MockLLMProvider:
     """
@@ -56,59 +89,26 @@ class MockLLMProvider:
         risk_level = risk_result.level
 
         # Anti-Hallucination: use ONLY factors from risk_result
-        why = risk_result.factors[:5] if risk_result.factors else []
-
         # Ensure at least one reason
-        if not why:
-            why = self._default_reasons(risk_level)
+        why = risk_result.factors[:5] or list(_DEFAULT_REASONS[risk_level])
 
         # Build summary based on risk level and completeness
         summary = self._build_summary(token_data, risk_result)
 
-        # Recommendation based on risk level
-        recommendations = {
-            RiskLevel.HIGH: Recommendation.AVOID,
-            RiskLevel.MEDIUM: Recommendation.CAUTION,
-            RiskLevel.LOW: Recommendation.OK,
-        }
-
         return AnalysisResult(
             risk=risk_level,
             summary=summary,
             why=why,
-            recommendation=recommendations[risk_level],
+            recommendation=_REC_BY_LEVEL[risk_level],
         )
 
-    def _default_reasons(self, risk_level: RiskLevel) -> list[str]:
-        """Default reasons when factors are empty."""
-        defaults = {
-            RiskLevel.HIGH: ["Обнаружены критические проблемы"],
-            RiskLevel.MEDIUM: ["Недостаточно данных для полного анализа"],
-            RiskLevel.LOW: ["Основные показатели в норме"],
-        }
-        return defaults[risk_level]
-
     def _build_summary(self, token_data: TokenData, risk_result: RiskResult) -> str:
         """Build summary based on risk level and completeness."""
         symbol = token_data.name or token_data.symbol or "Токен"
-        risk_level = risk_result.level
+        summary = _SUMMARY_TEMPLATES[risk_result.level].format(symbol=symbol)
 
         # Note about data completeness
-        completeness_note = ""
         if risk_result.safety_completeness < 1.0:
-            completeness_note = " Часть данных недоступна."
-
-        summaries = {
-            RiskLevel.HIGH: (
-                f"{symbol}: высокий риск. Обнаружены критические проблемы.{completeness_note}"
-            ),
-            RiskLevel.MEDIUM: (
-                f"{symbol}: средний риск. "
-                f"Требуется осторожность.{completeness_note}"
-            ),
-            RiskLevel.LOW: (
-                f"{symbol}: низкий риск. Основные показатели в норме.{completeness_note}"
-            ),
-        }
-
-        return summaries[risk_level]
+            summary += _COMPLETENESS_NOTE
+
+        return summary
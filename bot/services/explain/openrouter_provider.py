@@ -14,10 +14,14 @@ NO risk calculation (that's RiskService's job).
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import re
+from functools import partial
+from types import MappingProxyType
 
 import aiohttp
+import orjson
 
 from bot.core.exceptions import LLMError
 from bot.core.models import (
@@ -27,6 +31,8 @@ from bot.core.models import (
     RiskResult,
     TokenData,
 )
+from bot.services.explain.policy import REC_BY_RISK, canned_analysis
+from bot.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +42,32 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # Default timeout (SLA: 1.5 sec)
 DEFAULT_TIMEOUT = 1.5
 
+# JSON body inside a ```json / ``` fence, or the outermost {...} otherwise
+_FENCE_RE = re.compile(r"```(?:json)?(.*?)```", re.DOTALL)
+_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# LLM answer strings -> enum members (unknown strings fall back by risk)
+_RISK_BY_STR = MappingProxyType({level.value: level for level in RiskLevel})
+_REC_BY_STR = MappingProxyType({rec.value: rec for rec in Recommendation})
+
+# Maximum number of concurrent OpenRouter requests per provider
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Response cache defaults: identical inputs within an hour reuse the answer
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_MAXSIZE = 10_000
+
+# orjson options for the prompt data block: compact UTF-8, no indentation
+# (indentation only adds prompt tokens)
+_PROMPT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 # System prompt - Anti-Hallucination Contract
 SYSTEM_PROMPT = """Ты — аналитик рисков криптовалютных токенов.
 
 ANTI-HALLUCINATION CONTRACT:
 1. Используй ТОЛЬКО переданные данные и factors[]
 2. НЕ добавляй НОВЫЕ причины — используй ТОЛЬКО factors[]
-3. Если значение = null — считай неизвестным и укажи это
+3. Если поля нет или значение = null — считай неизвестным и укажи это
 4. НЕ делай предположений о данных, которых нет
 5. Risk level УЖЕ рассчитан системой — НЕ меняй его
 6. Ответ СТРОГО в JSON формате
@@ -62,6 +87,25 @@ ANTI-HALLUCINATION CONTRACT:
 - summary максимум 200 символов
 - Пиши на русском языке, будь кратким"""
 
+# System message as a content block marked for prompt caching, so the
+# provider can reuse the processed prefix across requests
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": [
+        {
+            "type": "text",
+            "text": SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ],
+}
+
+
+def _clip_str(value: object, limit: int) -> str:
+    """Convert to str and cut to limit, without copying already-short strings."""
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else text[:limit]
+
 
 class OpenRouterLLMProvider:
     """
@@ -78,6 +122,10 @@ class OpenRouterLLMProvider:
         api_key: str,
         model: str = "anthropic/claude-3.5-sonnet",
         timeout: float = DEFAULT_TIMEOUT,
+        session: aiohttp.ClientSession | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Initialize OpenRouter provider.
@@ -86,10 +134,25 @@ class OpenRouterLLMProvider:
             api_key: OpenRouter API key
             model: Model to use (default: claude-3.5-sonnet)
             timeout: Request timeout in seconds (default 1.5s)
+            session: Shared HTTP session; not closed by the provider.
+                When not given, the provider lazily opens its own pooled
+                session on first use and closes it in aclose().
+            cache_ttl: Lifetime of cached LLM answers in seconds
+            cache_maxsize: Maximum number of cached LLM answers
+            max_concurrency: Maximum number of concurrent API requests
         """
         self._api_key = api_key
         self._model = model
         self._timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        # Successful LLM answers by request fingerprint (fallbacks not cached)
+        self._cache: TTLCache[bytes, AnalysisResult] = TTLCache(
+            maxsize=cache_maxsize, ttl=cache_ttl
+        )
+        # Requests in progress by fingerprint; identical requests share one
+        self._inflight: dict[bytes, asyncio.Task[AnalysisResult]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def generate_analysis(
         self,
@@ -114,31 +177,107 @@ class OpenRouterLLMProvider:
             LLMError: If generation fails (after fallback attempt)
         """
         logger.info(
-            f"Generating LLM analysis for {token_data.symbol}, "
-            f"risk={risk_result.level.value}, "
-            f"factors={len(risk_result.factors)}"
+            "Generating LLM analysis for %s, risk=%s, factors=%d",
+            token_data.symbol,
+            risk_result.level.value,
+            len(risk_result.factors),
         )
 
-        try:
-            response = await asyncio.wait_for(
-                self._call_api(token_data, risk_result),
-                timeout=self._timeout,
+        cache_key = self._cache_key(token_data, risk_result)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug(
+                "LLM cache hit (hits=%d, misses=%d)",
+                self._cache.hits,
+                self._cache.misses,
+            )
+            return cached
+        logger.debug(
+            "LLM cache miss (hits=%d, misses=%d)",
+            self._cache.hits,
+            self._cache.misses,
+        )
+
+        # Join an identical request already in flight instead of sending another
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_analysis(token_data, risk_result, cache_key)
             )
+            self._inflight[cache_key] = task
+            task.add_done_callback(partial(self._fetch_done, cache_key))
+        else:
+            logger.debug("Joining in-flight LLM request")
+
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _fetch_analysis(
+        self,
+        token_data: TokenData,
+        risk_result: RiskResult,
+        cache_key: bytes,
+    ) -> AnalysisResult:
+        """Call the API (bounded by the semaphore) and cache a successful answer."""
+        try:
+            # Waiting for a semaphore slot counts against the timeout too,
+            # so queueing under load can't push past the latency budget
+            async with asyncio.timeout(self._timeout), self._semaphore:
+                response = await self._call_api(token_data, risk_result)
+            self._cache.set(cache_key, response)
             return response
 
         except TimeoutError:
-            logger.warning(f"OpenRouter timeout after {self._timeout}s, using fallback")
+            logger.warning(
+                "OpenRouter timeout after %ss, using fallback", self._timeout
+            )
             return self._generate_fallback(token_data, risk_result)
 
         except LLMError as e:
             # Use fallback for LLM errors too (API errors, parse errors)
-            logger.warning(f"LLM error: {e}, using fallback")
+            logger.warning("LLM error: %s, using fallback", e)
             return self._generate_fallback(token_data, risk_result)
 
         except Exception as e:
-            logger.warning(f"OpenRouter error: {e}, using fallback")
+            logger.warning("OpenRouter error: %s, using fallback", e)
             return self._generate_fallback(token_data, risk_result)
 
+    def _fetch_done(self, cache_key: bytes, task: asyncio.Task) -> None:
+        """
+        Forget a finished in-flight request.
+
+        Retrieves the task's exception, so a failure nobody awaited
+        (every waiter was cancelled) is logged here instead of as
+        "Task exception was never retrieved".
+        """
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.warning("In-flight LLM request failed: %r", exc)
+
+    def _cache_key(self, token_data: TokenData, risk_result: RiskResult) -> bytes:
+        """
+        Fingerprint everything that goes into the prompt.
+
+        Completeness is rounded to whole percents, as rendered in the prompt.
+        Factors are compared as a set, so the same reasons in a different
+        order share one entry.
+        """
+        key_data = {
+            "m": self._model,
+            "name": token_data.name,
+            "symbol": token_data.symbol,
+            "lvl": risk_result.level.value,
+            "signals": dict(risk_result.risk_signals),
+            "factors": sorted(set(risk_result.factors)),
+            "sc": round(risk_result.safety_completeness, 2),
+            "cc": round(risk_result.context_completeness, 2),
+        }
+        return hashlib.blake2b(
+            orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).digest()
+
     async def _call_api(
         self,
         token_data: TokenData,
@@ -153,7 +292,7 @@ class OpenRouterLLMProvider:
         payload = {
             "model": self._model,
             "messages": [
-                {"role": "system", "content": SYSTEM_PROMPT},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 0.2,  # Lower temperature for consistent output
@@ -167,28 +306,15 @@ class OpenRouterLLMProvider:
 
         timeout = aiohttp.ClientTimeout(total=self._timeout)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                OPENROUTER_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            ) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    logger.error(f"OpenRouter API error {resp.status}: {error_text}")
-                    raise LLMError(
-                        message="Сервис анализа временно недоступен.",
-                        technical_message=f"OpenRouter {resp.status}: {error_text}",
-                    )
-
-                data = await resp.json()
+        session = await self._get_session()
+        data = await self._post(session, payload, headers, timeout)
+        self._log_usage(data)
 
         # Extract content from response
         try:
             content = data["choices"][0]["message"]["content"]
         except (KeyError, IndexError) as e:
-            logger.error(f"Invalid OpenRouter response structure: {e}")
+            logger.error("Invalid OpenRouter response structure: %s", e)
             raise LLMError(
                 message="Ошибка формата ответа.",
                 technical_message=f"Invalid response: {e}",
@@ -197,6 +323,68 @@ class OpenRouterLLMProvider:
         # Parse and validate JSON response
         return self._parse_response(content, risk_result.level)
 
+    @staticmethod
+    def _log_usage(data: dict) -> None:
+        """Log prompt token usage, including tokens served from prompt cache."""
+        usage = data.get("usage")
+        if not isinstance(usage, dict):
+            return
+
+        details = usage.get("prompt_tokens_details") or {}
+        logger.debug(
+            "OpenRouter usage: prompt_tokens=%s cached_tokens=%s",
+            usage.get("prompt_tokens"),
+            details.get("cached_tokens", 0),
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, creating the provider-owned one on first use.
+
+        Keep-alive connections in the pool let warm requests skip the
+        DNS/TCP/TLS setup to openrouter.ai.
+        """
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if the provider created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        payload: dict,
+        headers: dict[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> dict:
+        """Send the completion request and return the decoded response body."""
+        async with session.post(
+            OPENROUTER_API_URL,
+            data=orjson.dumps(payload),
+            headers=headers,
+            timeout=timeout,
+        ) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                logger.error("OpenRouter API error %s: %s", resp.status, error_text)
+                raise LLMError(
+                    message="Сервис анализа временно недоступен.",
+                    technical_message=f"OpenRouter {resp.status}: {error_text}",
+                )
+
+            return orjson.loads(await resp.read())
+
     def _build_user_prompt(
         self,
         token_data: TokenData,
@@ -206,7 +394,7 @@ class OpenRouterLLMProvider:
         Build user prompt with token data and factors (Anti-Hallucination Contract).
 
         LLM receives:
-        - risk_signals: raw data (with null for unknown)
+        - risk_signals: known raw data only (unknown signals are omitted)
         - factors: pre-calculated reasons (LLM must use ONLY these)
         - completeness scores: data quality indicators
         """
@@ -219,20 +407,25 @@ class OpenRouterLLMProvider:
             "risk_level": risk_result.level.value,
             "safety_completeness": f"{risk_result.safety_completeness:.0%}",
             "context_completeness": f"{risk_result.context_completeness:.0%}",
-            "risk_signals": risk_result.risk_signals,
+            # null means "unknown"; omitting those keys saves prompt tokens
+            "risk_signals": {
+                key: value
+                for key, value in risk_result.risk_signals.items()
+                if value is not None
+            },
             "factors": risk_result.factors,
         }
 
         return f"""Проанализируй токен.
 
 ДАННЫЕ (Anti-Hallucination Contract):
-{json.dumps(prompt_data, ensure_ascii=False, indent=2)}
+{orjson.dumps(prompt_data, option=_PROMPT_JSON_OPTIONS).decode()}
 
 ВАЖНО:
 - Уровень риска УЖЕ рассчитан: {risk_result.level.value}
 - Используй ТОЛЬКО factors[] для поля "why"
 - НЕ добавляй новые причины
-- null в risk_signals = данные неизвестны
+- risk_signals содержит только известные поля; отсутствующее поле = данные неизвестны
 
 Ответь в JSON формате."""
 
@@ -246,17 +439,16 @@ class OpenRouterLLMProvider:
         """
         # Try to extract JSON from response
         try:
-            # Handle potential markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
+            # Handle potential markdown code blocks or text around the object
+            match = _FENCE_RE.search(content) or _OBJECT_RE.search(content)
+            if match is not None:
+                content = match.group(match.lastindex or 0)
 
-            data = json.loads(content.strip())
+            data = orjson.loads(content.strip())
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM JSON: {e}")
-            logger.debug(f"Raw content: {content}")
+        except ValueError as e:
+            logger.error("Failed to parse LLM JSON: %s", e)
+            logger.debug("Raw content: %s", content)
             raise LLMError(
                 message="Ошибка формата ответа.",
                 technical_message=f"JSON parse error: {e}",
@@ -265,36 +457,26 @@ class OpenRouterLLMProvider:
         # Validate and extract fields
         try:
             # Risk level
-            risk_str = data.get("risk", expected_risk.value).lower()
-            try:
-                risk = RiskLevel(risk_str)
-            except ValueError:
-                risk = expected_risk
+            risk_str = str(data.get("risk", expected_risk.value)).lower()
+            risk = _RISK_BY_STR.get(risk_str, expected_risk)
 
             # Summary
-            summary = str(data.get("summary", "Анализ недоступен."))[:500]
+            summary = _clip_str(data.get("summary", "Анализ недоступен."), 500)
 
             # Why (reasons)
             why_raw = data.get("why", [])
             if isinstance(why_raw, list):
-                why = [str(r)[:200] for r in why_raw[:5]]
+                why = [_clip_str(r, 200) for r in why_raw[:5]]
             else:
-                why = [str(why_raw)[:200]]
+                why = [_clip_str(why_raw, 200)]
 
             if not why:
                 why = ["Причины не указаны"]
 
             # Recommendation
-            rec_str = data.get("recommendation", "caution").lower()
-            try:
-                recommendation = Recommendation(rec_str)
-            except ValueError:
-                # Map risk to recommendation as fallback
-                recommendation = {
-                    RiskLevel.HIGH: Recommendation.AVOID,
-                    RiskLevel.MEDIUM: Recommendation.CAUTION,
-                    RiskLevel.LOW: Recommendation.OK,
-                }.get(risk, Recommendation.CAUTION)
+            rec_str = str(data.get("recommendation", "caution")).lower()
+            # Map risk to recommendation as fallback
+            recommendation = _REC_BY_STR.get(rec_str) or REC_BY_RISK[risk]
 
             return AnalysisResult(
                 risk=risk,
@@ -304,7 +486,7 @@ class OpenRouterLLMProvider:
             )
 
         except Exception as e:
-            logger.error(f"Failed to validate LLM response: {e}")
+            logger.error("Failed to validate LLM response: %s", e)
             raise LLMError(
                 message="Ошибка формата ответа.",
                 technical_message=f"Validation error: {e}",
@@ -321,43 +503,4 @@ class OpenRouterLLMProvider:
         Uses factors from risk_result (Anti-Hallucination Contract).
         """
         logger.info("Using fallback template for analysis")
-
-        risk_level = risk_result.level
-
-        # Use pre-calculated factors (Anti-Hallucination)
-        why = risk_result.factors[:5] if risk_result.factors else []
-
-        # Ensure at least one reason
-        if not why:
-            if risk_level == RiskLevel.HIGH:
-                why = ["Обнаружены критические проблемы"]
-            elif risk_level == RiskLevel.MEDIUM:
-                why = ["Недостаточно данных для полного анализа"]
-            else:
-                why = ["Основные показатели в норме"]
-
-        # Build summary based on completeness
-        symbol = token_data.symbol or "Токен"
-        if risk_result.safety_completeness < 1.0:
-            completeness_note = " Часть данных недоступна."
-        else:
-            completeness_note = ""
-
-        summaries = {
-            RiskLevel.HIGH: f"{symbol}: высокий риск.{completeness_note}",
-            RiskLevel.MEDIUM: f"{symbol}: средний риск.{completeness_note}",
-            RiskLevel.LOW: f"{symbol}: низкий риск.{completeness_note}",
-        }
-
-        recommendations = {
-            RiskLevel.HIGH: Recommendation.AVOID,
-            RiskLevel.MEDIUM: Recommendation.CAUTION,
-            RiskLevel.LOW: Recommendation.OK,
-        }
-
-        return AnalysisResult(
-            risk=risk_level,
-            summary=summaries[risk_level],
-            why=why,
-            recommendation=recommendations[risk_level],
-        )
+        return canned_analysis(token_data, risk_result)
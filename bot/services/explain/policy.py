@@ -0,0 +1,101 @@
+"""
+Explanation policy.
+
+Decides when a risk result needs no LLM explanation and builds the
+canned answer used in that case (and as the fallback when the LLM fails).
+
+Canned answers use only risk_result.factors (Anti-Hallucination Contract).
+"""
+
+from types import MappingProxyType
+
+from bot.core.models import (
+    AnalysisResult,
+    Recommendation,
+    RiskLevel,
+    RiskResult,
+    TokenData,
+)
+from bot.services.risk.service import SAFE_PROTOCOL_FACTOR
+
+# Minimum safety and context completeness for a LOW verdict to be final
+DETERMINISTIC_MIN_COMPLETENESS = 0.9
+
+# Recommendation implied by each risk level
+REC_BY_RISK = MappingProxyType(
+    {
+        RiskLevel.HIGH: Recommendation.AVOID,
+        RiskLevel.MEDIUM: Recommendation.CAUTION,
+        RiskLevel.LOW: Recommendation.OK,
+    }
+)
+
+# Canned answer templates
+_SUMMARIES = MappingProxyType(
+    {
+        RiskLevel.HIGH: "{symbol}: высокий риск.{note}",
+        RiskLevel.MEDIUM: "{symbol}: средний риск.{note}",
+        RiskLevel.LOW: "{symbol}: низкий риск.{note}",
+    }
+)
+_DEFAULT_REASONS = MappingProxyType(
+    {
+        RiskLevel.HIGH: ("Обнаружены критические проблемы",),
+        RiskLevel.MEDIUM: ("Недостаточно данных для полного анализа",),
+        RiskLevel.LOW: ("Основные показатели в норме",),
+    }
+)
+_COMPLETENESS_NOTE = " Часть данных недоступна."
+
+# Factors RiskService emits that state the absence of risk; any other
+# factor is a warning worth explaining, even on a LOW verdict
+_POSITIVE_FACTORS = frozenset({SAFE_PROTOCOL_FACTOR})
+
+
+def is_deterministic(risk_result: RiskResult) -> bool:
+    """
+    Whether the explanation is fully determined by the verdict.
+
+    True when no signal is known (an LLM could only echo the level),
+    or for LOW risk backed by near-complete data and no warning factors
+    (the answer is boilerplate). Such results get a canned explanation,
+    no LLM call.
+    """
+    if risk_result.total_completeness == 0.0:
+        return True
+    return (
+        risk_result.level is RiskLevel.LOW
+        and risk_result.safety_completeness >= DETERMINISTIC_MIN_COMPLETENESS
+        and risk_result.context_completeness >= DETERMINISTIC_MIN_COMPLETENESS
+        and _POSITIVE_FACTORS.issuperset(risk_result.factors)
+    )
+
+
+def canned_analysis(token_data: TokenData, risk_result: RiskResult) -> AnalysisResult:
+    """
+    Build a template answer from the verdict and its factors.
+
+    Args:
+        token_data: Normalized token information
+        risk_result: Pre-calculated risk with factors and completeness scores
+
+    Returns:
+        AnalysisResult with at least one reason
+    """
+    risk_level = risk_result.level
+
+    # Use pre-calculated factors (Anti-Hallucination), at least one reason
+    why = list(risk_result.factors[:5] or _DEFAULT_REASONS[risk_level])
+
+    note = _COMPLETENESS_NOTE if risk_result.safety_completeness < 1.0 else ""
+    summary = _SUMMARIES[risk_level].format(
+        symbol=token_data.symbol or "Токен",
+        note=note,
+    )
+
+    return AnalysisResult(
+        risk=risk_level,
+        summary=summary,
+        why=why,
+        recommendation=REC_BY_RISK[risk_level],
+    )
@@ -6,9 +6,10 @@ This service is the bridge between raw data and user-friendly output.
 
 Responsibilities:
 1. Take token data and risk level
-2. Call LLM provider to generate explanation
-3. Return structured AnalysisResult
-4. Enforce timeout on LLM calls
+2. Answer from a template when the verdict says it all
+3. Otherwise call LLM provider to generate explanation
+4. Return structured AnalysisResult
+5. Enforce timeout on LLM calls
 """
 
 import asyncio
@@ -17,6 +18,7 @@ import logging
 from bot.core.exceptions import LLMError
 from bot.core.models import AnalysisResult, RiskResult, TokenData
 from bot.core.protocols import LLMProvider
+from bot.services.explain.policy import canned_analysis, is_deterministic
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +62,8 @@ class ExplainService:
         Generate explanation for token analysis.
 
         Calls the LLM to produce a human-readable summary
-        of why the token has its risk level.
+        of why the token has its risk level. Deterministic verdicts
+        (see policy.is_deterministic) get a canned answer instead.
 
         Anti-Hallucination Contract:
         - LLM receives risk_result.factors[] and must use ONLY these
@@ -77,32 +80,42 @@ class ExplainService:
         Raises:
             LLMError: If explanation generation fails
         """
-        logger.info(
-            f"Generating explanation for {token_data.symbol}, "
-            f"risk={risk_result.level.value}, "
-            f"safety={risk_result.safety_completeness:.0%}, "
-            f"context={risk_result.context_completeness:.0%}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generating explanation for %s, risk=%s, safety=%.0f%%, context=%.0f%%",
+                token_data.symbol,
+                risk_result.level.value,
+                risk_result.safety_completeness * 100,
+                risk_result.context_completeness * 100,
+            )
+
+        # No known signals, or clean token with near-complete data:
+        # the canned template says all the LLM could
+        if is_deterministic(risk_result):
+            logger.info("Deterministic verdict, skipping LLM")
+            return canned_analysis(token_data, risk_result)
 
         try:
-            # Enforce timeout on LLM call
-            result = await asyncio.wait_for(
-                self._llm_provider.generate_analysis(
+            # Enforce timeout on LLM call. This only stops this caller waiting:
+            # a provider may run the request as shared, shielded work
+            # (OpenRouter does), which keeps its connection until the
+            # provider's own request timeout
+            async with asyncio.timeout(self._timeout):
+                result = await self._llm_provider.generate_analysis(
                     token_data,
                     risk_result,
-                ),
-                timeout=self._timeout,
-            )
+                )
 
             logger.debug(
-                f"Explanation generated: {len(result.summary)} chars, "
-                f"{len(result.why)} reasons"
+                "Explanation generated: %d chars, %d reasons",
+                len(result.summary),
+                len(result.why),
             )
 
             return result
 
         except TimeoutError:
-            logger.error(f"LLM timeout after {self._timeout}s")
+            logger.error("LLM timeout after %ss", self._timeout)
             raise LLMError(
                 message="Сервис анализа не ответил вовремя. Попробуйте позже.",
                 technical_message=f"LLM timeout after {self._timeout}s",
@@ -114,7 +127,7 @@ class ExplainService:
 
         except Exception as e:
             # Wrap unexpected errors
-            logger.exception(f"Unexpected error generating explanation: {e}")
+            logger.exception("Unexpected error generating explanation")
             raise LLMError(
                 message="Не удалось сгенерировать анализ.",
                 technical_message=f"LLM error: {type(e).__name__}: {e}",
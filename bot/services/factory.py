@@ -8,21 +8,25 @@ This is the single point of service creation - all services
 should be created through this factory.
 """
 
+import asyncio
 import logging
 
+import aiohttp
+
 from bot.config.settings import Settings
 from bot.core.protocols import LLMProvider, TokenDataProvider
 from bot.services.explain.mock_llm import MockLLMProvider
-from bot.services.explain.openrouter_provider import OpenRouterLLMProvider
 from bot.services.explain.service import ExplainService
 from bot.services.orchestrator import AnalyzerOrchestrator
 from bot.services.risk.service import RiskService
 from bot.services.token_data.aggregator import TokenDataAggregator
-from bot.services.token_data.helius_provider import HeliusTokenDataProvider
 from bot.services.token_data.mock_provider import MockTokenDataProvider
 
 logger = logging.getLogger(__name__)
 
+# Time limit for each warmup request (seconds)
+WARMUP_TIMEOUT = 5.0
+
 
 class ServiceFactory:
     """
@@ -33,20 +37,43 @@ class ServiceFactory:
     - Real implementations for production (USE_MOCK_SERVICES=false)
 
     All services are created lazily and cached for reuse.
+    Real providers share one pooled HTTP session; call close() on
+    shutdown to release it.
 
     Usage:
         factory = ServiceFactory(settings)
         orchestrator = factory.create_orchestrator()
+        ...
+        await factory.close()
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        http_session: aiohttp.ClientSession | None = None,
+    ):
         """
         Initialize factory with application settings.
 
         Args:
             settings: Application configuration
+            http_session: Shared HTTP session handed to real providers.
+                If given, it is owned by the caller, which must close it;
+                otherwise the factory creates and owns one on first use.
         """
         self._settings = settings
+        self._http_session = http_session
+        self._owns_http_session = http_session is None
+
+        # Instances built on first request and reused afterwards, so
+        # providers (and their connection pools) are created only once
+        self._token_data_provider: TokenDataProvider | None = None
+        self._llm_provider: LLMProvider | None = None
+        self._aggregator: TokenDataAggregator | None = None
+        self._risk_service: RiskService | None = None
+        self._explain_service: ExplainService | None = None
+        self._orchestrator: AnalyzerOrchestrator | None = None
+
         self._log_mode()
 
     def _log_mode(self) -> None:
@@ -54,44 +81,117 @@ class ServiceFactory:
         mode = "MOCK" if self._settings.use_mock_services else "PRODUCTION"
         logger.info(f"ServiceFactory initialized in {mode} mode")
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session shared by real providers.
+
+        Created on first use, so mock mode never opens one. Keeps
+        connections, TLS sessions and DNS lookups alive across requests.
+
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._settings.http_pool_max_connections,
+                    limit_per_host=self._settings.http_pool_max_per_host,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+            )
+        return self._http_session
+
+    async def warmup(self) -> None:
+        """
+        Open connections to external APIs ahead of the first analysis.
+
+        Sends a HEAD request to each backend through the shared session,
+        so the first user doesn't pay for TCP/TLS handshakes. Response
+        status is ignored and failures are only logged; no-op in mock mode.
+        """
+        if self._settings.use_mock_services:
+            return
+
+        from bot.services.explain.openrouter_provider import OPENROUTER_API_URL
+        from bot.services.token_data.helius_provider import HELIUS_RPC_URL
+
+        session = self._get_http_session()
+        timeout = aiohttp.ClientTimeout(total=WARMUP_TIMEOUT)
+
+        async def head(url: str) -> None:
+            try:
+                async with session.head(url, timeout=timeout):
+                    pass
+            except (aiohttp.ClientError, TimeoutError) as e:
+                logger.warning("Warmup request to %s failed: %s", url, e)
+
+        await asyncio.gather(head(HELIUS_RPC_URL), head(OPENROUTER_API_URL))
+        logger.info("HTTP connections warmed up")
+
+    async def close(self) -> None:
+        """Close the shared HTTP session if the factory created it."""
+        if self._owns_http_session and self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
     def create_token_data_provider(self) -> TokenDataProvider:
         """
-        Create token data provider.
+        Create token data provider (cached).
 
         Returns:
             TokenDataProvider implementation based on settings
         """
+        if self._token_data_provider is not None:
+            return self._token_data_provider
+
         if self._settings.use_mock_services:
             logger.debug("Creating MockTokenDataProvider")
-            return MockTokenDataProvider()
-
-        logger.debug("Creating HeliusTokenDataProvider")
-        return HeliusTokenDataProvider(
-            api_key=self._settings.helius_api_key,
-            timeout=1.2,  # SLA: Telegram UX requires fast response
-        )
+            self._token_data_provider = MockTokenDataProvider()
+        else:
+            # Real providers are imported on first use, so mock runs skip them
+            from bot.services.token_data.helius_provider import (
+                HeliusTokenDataProvider,
+            )
+
+            logger.debug("Creating HeliusTokenDataProvider")
+            self._token_data_provider = HeliusTokenDataProvider(
+                api_key=self._settings.helius_api_key,
+                timeout=1.2,  # SLA: Telegram UX requires fast response
+                session=self._get_http_session(),
+            )
+        return self._token_data_provider
 
     def create_llm_provider(self) -> LLMProvider:
         """
-        Create LLM provider.
+        Create LLM provider (cached).
 
         Returns:
             LLMProvider implementation based on settings
         """
+        if self._llm_provider is not None:
+            return self._llm_provider
+
         if self._settings.use_mock_services:
             logger.debug("Creating MockLLMProvider")
-            return MockLLMProvider()
-
-        logger.debug("Creating OpenRouterLLMProvider")
-        return OpenRouterLLMProvider(
-            api_key=self._settings.openrouter_api_key,
-            model=self._settings.llm_model,
-            timeout=1.5,  # SLA: Telegram UX requires fast response
-        )
+            self._llm_provider = MockLLMProvider()
+        else:
+            from bot.services.explain.openrouter_provider import (
+                OpenRouterLLMProvider,
+            )
+
+            logger.debug("Creating OpenRouterLLMProvider")
+            self._llm_provider = OpenRouterLLMProvider(
+                api_key=self._settings.openrouter_api_key,
+                model=self._settings.llm_model,
+                timeout=1.5,  # SLA: Telegram UX requires fast response
+                session=self._get_http_session(),
+            )
+        return self._llm_provider
 
     def create_token_data_aggregator(self) -> TokenDataAggregator:
         """
-        Create token data aggregator.
+        Create token data aggregator (cached).
 
         Creates aggregator with the appropriate provider
         based on current settings.
@@ -99,25 +199,32 @@ class ServiceFactory:
         Returns:
             TokenDataAggregator configured with provider
         """
-        provider = self.create_token_data_provider()
-        logger.debug("Creating TokenDataAggregator")
-        return TokenDataAggregator(provider)
+        if self._aggregator is None:
+            provider = self.create_token_data_provider()
+            logger.debug("Creating TokenDataAggregator")
+            self._aggregator = TokenDataAggregator(
+                provider,
+                cache_ttl=self._settings.token_data_cache_ttl,
+            )
+        return self._aggregator
 
     def create_risk_service(self) -> RiskService:
         """
-        Create risk calculation service.
+        Create risk calculation service (cached).
 
         Risk service uses the same logic for both mock and production.
 
         Returns:
             RiskService with default thresholds
         """
-        logger.debug("Creating RiskService")
-        return RiskService()
+        if self._risk_service is None:
+            logger.debug("Creating RiskService")
+            self._risk_service = RiskService()
+        return self._risk_service
 
     def create_explain_service(self) -> ExplainService:
         """
-        Create explanation service.
+        Create explanation service (cached).
 
         Creates service with the appropriate LLM provider
         based on current settings.
@@ -125,13 +232,15 @@ class ServiceFactory:
         Returns:
             ExplainService configured with LLM provider
         """
-        llm_provider = self.create_llm_provider()
-        logger.debug("Creating ExplainService")
-        return ExplainService(llm_provider)
+        if self._explain_service is None:
+            llm_provider = self.create_llm_provider()
+            logger.debug("Creating ExplainService")
+            self._explain_service = ExplainService(llm_provider)
+        return self._explain_service
 
     def create_orchestrator(self) -> AnalyzerOrchestrator:
         """
-        Create the main analyzer orchestrator.
+        Create the main analyzer orchestrator (cached).
 
         This is the primary service used by handlers.
         Creates all dependencies automatically.
@@ -139,14 +248,14 @@ class ServiceFactory:
         Returns:
             AnalyzerOrchestrator ready for use
         """
-        logger.info("Creating AnalyzerOrchestrator with all dependencies")
+        if self._orchestrator is not None:
+            return self._orchestrator
 
-        aggregator = self.create_token_data_aggregator()
-        risk_service = self.create_risk_service()
-        explain_service = self.create_explain_service()
+        logger.info("Creating AnalyzerOrchestrator with all dependencies")
 
-        return AnalyzerOrchestrator(
-            aggregator=aggregator,
-            risk_service=risk_service,
-            explain_service=explain_service,
+        self._orchestrator = AnalyzerOrchestrator(
+            aggregator=self.create_token_data_aggregator(),
+            risk_service=self.create_risk_service(),
+            explain_service=self.create_explain_service(),
         )
+        return self._orchestrator
@@ -12,7 +12,10 @@ Workflow:
 4. Return AnalysisResult
 """
 
+import asyncio
 import logging
+import time
+from functools import partial
 
 from bot.core.models import AnalysisResult
 from bot.services.explain.service import ExplainService
@@ -21,6 +24,9 @@ from bot.services.token_data.aggregator import TokenDataAggregator
 
 logger = logging.getLogger(__name__)
 
+# How long shutdown() waits for running analyses before cancelling them
+DEFAULT_GRACEFUL_TIMEOUT = 5.0
+
 
 class AnalyzerOrchestrator:
     """
@@ -60,6 +66,8 @@ class AnalyzerOrchestrator:
         self._aggregator = aggregator
         self._risk_service = risk_service
         self._explain_service = explain_service
+        # Running analyses by token address, joined by concurrent duplicates
+        self._inflight: dict[str, asyncio.Task[AnalysisResult]] = {}
 
     async def analyze(self, token_address: str) -> AnalysisResult:
         """
@@ -81,31 +89,101 @@ class AnalyzerOrchestrator:
             DataFetchError: If token data cannot be fetched
             LLMError: If explanation cannot be generated
         """
-        logger.info(f"Starting analysis for token: {token_address[:8]}...")
+        # Join an analysis of the same token already in flight instead of
+        # fetching data and calling the LLM a second time
+        task = self._inflight.get(token_address)
+        if task is None:
+            task = asyncio.create_task(self._run_analysis(token_address))
+            self._inflight[token_address] = task
+            task.add_done_callback(partial(self._analysis_done, token_address))
+        else:
+            logger.debug("Joining in-flight analysis for %s...", token_address[:8])
+
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def shutdown(
+        self, graceful_timeout: float = DEFAULT_GRACEFUL_TIMEOUT
+    ) -> None:
+        """
+        Stop running analyses before the process exits.
+
+        Gives in-flight analyses up to graceful_timeout seconds to finish,
+        then cancels the rest and waits for them to unwind, so their HTTP
+        connections are released before the session is closed.
+
+        Args:
+            graceful_timeout: Seconds to wait for running analyses
+        """
+        tasks = set(self._inflight.values())
+        if not tasks:
+            return
+
+        logger.info("Waiting for %d running analyses...", len(tasks))
+        _, pending = await asyncio.wait(tasks, timeout=graceful_timeout)
+
+        if pending:
+            logger.warning("Cancelling %d unfinished analyses", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    def _analysis_done(self, token_address: str, task: asyncio.Task) -> None:
+        """
+        Forget a finished analysis.
+
+        Retrieves the task's exception, so a failure nobody awaited (every
+        waiter was cancelled) doesn't end up as "Task exception was never
+        retrieved". Waiting callers get the error themselves and report it.
+        """
+        if self._inflight.get(token_address) is task:
+            del self._inflight[token_address]
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.debug("Analysis for %s... failed: %r", token_address[:8], exc)
+
+    async def _run_analysis(self, token_address: str) -> AnalysisResult:
+        """Run the fetch -> risk -> explain pipeline for one token."""
+        logger.info("Starting analysis for token: %s...", token_address[:8])
+
+        # Stage timings, reported with the final log line
+        started = time.perf_counter()
 
         # Step 1: Fetch token data
         token_data = await self._aggregator.get_token_data(token_address)
-        liq_str = (
-            f"${token_data.liquidity_usd:,.0f}"
-            if token_data.liquidity_usd is not None
-            else "N/A"
-        )
-        logger.debug(f"Token data: {token_data.symbol or 'UNKNOWN'}, {liq_str}")
+        fetched = time.perf_counter()
+        if logger.isEnabledFor(logging.DEBUG):
+            liq_str = (
+                f"${token_data.liquidity_usd:,.0f}"
+                if token_data.liquidity_usd is not None
+                else "N/A"
+            )
+            logger.debug("Token data: %s, %s", token_data.symbol or "UNKNOWN", liq_str)
 
         # Step 2: Calculate risk level (returns RiskResult with completeness scores)
         risk_result = self._risk_service.calculate_risk(token_data)
-        logger.info(
-            f"Risk calculated: {risk_result.level.value}, "
-            f"safety={risk_result.safety_completeness:.0%}, "
-            f"context={risk_result.context_completeness:.0%}, "
-            f"factors={len(risk_result.factors)}"
-        )
+        scored = time.perf_counter()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk calculated: %s, safety=%.0f%%, context=%.0f%%, factors=%d",
+                risk_result.level.value,
+                risk_result.safety_completeness * 100,
+                risk_result.context_completeness * 100,
+                len(risk_result.factors),
+            )
 
         # Step 3: Generate explanation (LLM uses only factors from risk_result)
         result = await self._explain_service.explain(token_data, risk_result)
-        logger.info(
-            f"Analysis complete for {token_data.symbol}: "
-            f"{risk_result.level.value} risk, {result.recommendation.value}"
-        )
+        explained = time.perf_counter()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Analysis complete for %s: %s risk, %s "
+                "(fetch=%.0fms, risk=%.2fms, explain=%.0fms)",
+                token_data.symbol,
+                risk_result.level.value,
+                result.recommendation.value,
+                (fetched - started) * 1000,
+                (scored - fetched) * 1000,
+                (explained - scored) * 1000,
+            )
 
         return result
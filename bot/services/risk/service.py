@@ -18,10 +18,11 @@ Decision Matrix:
 """
 
 import logging
+import math
 from dataclasses import dataclass
-from typing import Any
+from typing import Final, NamedTuple
 
-from bot.core.models import RiskLevel, RiskResult, TokenData
+from bot.core.models import RiskLevel, RiskResult, SocialFlag, TokenData
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,84 @@ SAFE_PROTOCOL_TOKENS = {
     "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT (Tether)
 }
 
+# The only factor reported for SafeList tokens
+SAFE_PROTOCOL_FACTOR: Final = "Базовый протокольный токен Solana"
+
+# Result for SafeList tokens: identical for every address, so one instance
+# is shared (RiskResult freezes factors and risk_signals, so it can't change)
+_SAFELIST_RESULT: Final = RiskResult(
+    level=RiskLevel.LOW,
+    safety_completeness=1.0,
+    context_completeness=1.0,
+    risk_signals={"safelist": True},
+    factors=[SAFE_PROTOCOL_FACTOR],
+)
+
+# Critical signals reported as unavailable when None, in display order
+UNKNOWN_SIGNAL_FACTORS: Final = (
+    ("mint_authority_exists", "Данные о mint authority недоступны"),
+    ("freeze_authority_exists", "Данные о freeze authority недоступны"),
+    ("top1_holder_percent", "Данные о крупнейшем держателе недоступны"),
+    ("top2_holder_percent", "Данные о втором крупнейшем держателе недоступны"),
+    ("top10_holders_percent", "Данные о распределении токенов недоступны"),
+)
+
+# Labels for missing social channels, in display order
+SOCIAL_LABELS: Final = (
+    (SocialFlag.TWITTER, "Twitter"),
+    (SocialFlag.TELEGRAM, "Telegram"),
+    (SocialFlag.WEBSITE, "сайт"),
+)
+
+
+class Signals(NamedTuple):
+    """
+    Raw risk signals of one token (None = unknown).
+
+    Critical signals come first, so completeness can slice them off.
+    Converted to a dict only once, for RiskResult.risk_signals.
+    """
+
+    # Critical signals (6) — affect LOW-gate
+    mint_authority_exists: bool | None
+    freeze_authority_exists: bool | None
+    top1_holder_percent: float | None
+    top2_holder_percent: float | None
+    top5_holders_percent: float | None
+    top10_holders_percent: float | None
+    # Contextual signals (4) — for explanation quality
+    age_days: int | None
+    liquidity_usd: float | None
+    metadata_mutable: bool | None
+    holders: int
+
+
+# Signals fields by group, in declaration order (completeness slices
+# Signals by these, so they must match its layout)
+CRITICAL_SIGNAL_FIELDS: Final = (
+    "mint_authority_exists",
+    "freeze_authority_exists",
+    "top1_holder_percent",
+    "top2_holder_percent",
+    "top5_holders_percent",
+    "top10_holders_percent",
+)
+# Contextual fields that may be unknown; holders is always set and
+# counts as known when > 0
+NULLABLE_CONTEXT_FIELDS: Final = ("age_days", "liquidity_usd", "metadata_mutable")
+CONTEXT_SIGNAL_FIELDS: Final = (*NULLABLE_CONTEXT_FIELDS, "holders")
+
+CRITICAL_SIGNAL_COUNT: Final = len(CRITICAL_SIGNAL_FIELDS)
+CONTEXT_SIGNAL_COUNT: Final = len(CONTEXT_SIGNAL_FIELDS)
+_NULLABLE_CONTEXT_SLICE: Final = slice(
+    CRITICAL_SIGNAL_COUNT, CRITICAL_SIGNAL_COUNT + len(NULLABLE_CONTEXT_FIELDS)
+)
+
+# Stand-ins for unknown values in threshold checks: an unknown value
+# never exceeds an upper limit (-inf) or falls below a lower one (+inf)
+_NEG_INF: Final = -math.inf
+_POS_INF: Final = math.inf
+
 
 @dataclass(frozen=True)
 class RiskThresholds:
@@ -75,8 +154,8 @@ class RiskService:
     - level: HIGH/MEDIUM/LOW
     - safety_completeness: 0.0-1.0 (critical signals)
     - context_completeness: 0.0-1.0 (contextual signals)
-    - risk_signals: dict for LLM
-    - factors: human-readable reasons
+    - risk_signals: read-only mapping for LLM
+    - factors: human-readable reasons (tuple)
 
     Usage:
         service = RiskService()
@@ -112,104 +191,91 @@ class RiskService:
         # data.address = mint address токена (проверено в models.py)
         if token_data.address in SAFE_PROTOCOL_TOKENS:
             logger.info(
-                f"Token {token_data.symbol}: LOW risk (SafeList protocol token)"
-            )
-            return RiskResult(
-                level=RiskLevel.LOW,
-                safety_completeness=1.0,
-                context_completeness=1.0,
-                risk_signals={"safelist": True},
-                factors=["Базовый протокольный токен Solana"],
+                "Token %s: LOW risk (SafeList protocol token)", token_data.symbol
             )
+            return _SAFELIST_RESULT
 
         # Extract signals and calculate completeness
         signals = self._extract_signals(token_data)
         safety_score = self._calculate_safety_completeness(signals)
         context_score = self._calculate_context_completeness(signals)
-        factors = self.get_risk_factors(token_data)
+        factors = self.get_risk_factors(
+            token_data, signals, safety_score, context_score
+        )
 
         # Log for debugging
-        self._log_risk_check(token_data, safety_score, context_score)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_risk_check(token_data, safety_score, context_score)
 
         # Determine risk level
         if self._is_high_risk(token_data):
             level = RiskLevel.HIGH
-            logger.info(f"Token {token_data.symbol}: HIGH risk")
-        elif self._is_low_risk(token_data):
+            logger.info("Token %s: HIGH risk", token_data.symbol)
+        # LOW needs every critical signal known: skip the check otherwise
+        elif safety_score == 1.0 and self._is_low_risk(token_data):
             level = RiskLevel.LOW
-            logger.info(f"Token {token_data.symbol}: LOW risk")
+            logger.info("Token %s: LOW risk", token_data.symbol)
         else:
             level = RiskLevel.MEDIUM
             logger.info(
-                f"Token {token_data.symbol}: MEDIUM risk "
-                f"(safety={safety_score:.0%}, context={context_score:.0%})"
+                "Token %s: MEDIUM risk (safety=%.0f%%, context=%.0f%%)",
+                token_data.symbol,
+                safety_score * 100,
+                context_score * 100,
             )
 
         return RiskResult(
             level=level,
             safety_completeness=safety_score,
             context_completeness=context_score,
-            risk_signals=signals,
+            risk_signals=signals._asdict(),
             factors=factors,
         )
 
-    def _extract_signals(self, data: TokenData) -> dict[str, Any]:
+    def _extract_signals(self, data: TokenData) -> Signals:
         """
         Extract all risk signals from token data (v2.2).
 
-        Returns dict with None for unknown values (for LLM Anti-Hallucination).
+        Returns Signals with None for unknown values (for LLM Anti-Hallucination).
         """
-        return {
-            # Critical signals (6) — affect LOW-gate
-            "mint_authority_exists": data.mint_authority_exists,
-            "freeze_authority_exists": data.freeze_authority_exists,
-            "top1_holder_percent": data.top1_holder_percent,
-            "top2_holder_percent": data.top2_holder_percent,
-            "top5_holders_percent": data.top5_holders_percent,
-            "top10_holders_percent": data.top10_holders_percent,
-            # Contextual signals (4) — for explanation quality
-            "age_days": data.age_days,
-            "liquidity_usd": data.liquidity_usd,
-            "metadata_mutable": data.metadata_mutable,
-            "holders": data.holders,
-        }
-
-    def _calculate_safety_completeness(self, signals: dict[str, Any]) -> float:
+        return Signals(
+            data.mint_authority_exists,
+            data.freeze_authority_exists,
+            data.top1_holder_percent,
+            data.top2_holder_percent,
+            data.top5_holders_percent,
+            data.top10_holders_percent,
+            data.age_days,
+            data.liquidity_usd,
+            data.metadata_mutable,
+            data.holders,
+        )
+
+    def _calculate_safety_completeness(self, signals: Signals) -> float:
         """
         Calculate completeness of critical signals (affects LOW-gate).
 
         Critical signals (6): mint, freeze, top1, top2, top5, top10
         """
-        critical_signals = [
-            "mint_authority_exists",
-            "freeze_authority_exists",
-            "top1_holder_percent",
-            "top2_holder_percent",
-            "top5_holders_percent",
-            "top10_holders_percent",
-        ]
-        known = sum(1 for s in critical_signals if signals.get(s) is not None)
-        return known / len(critical_signals)
-
-    def _calculate_context_completeness(self, signals: dict[str, Any]) -> float:
+        # tuple.count runs in C: one pass, no per-field Python branch
+        unknown = signals[:CRITICAL_SIGNAL_COUNT].count(None)
+        return (CRITICAL_SIGNAL_COUNT - unknown) / CRITICAL_SIGNAL_COUNT
+
+    def _calculate_context_completeness(self, signals: Signals) -> float:
         """
         Calculate completeness of contextual signals (affects explanation quality).
 
         Contextual signals (4): age, liquidity, metadata_mutable, holders
         """
-        context_signals = ["age_days", "liquidity_usd", "metadata_mutable", "holders"]
-        # holders is always known (has default 0), so check if it's > 0 for "known"
-        known = sum(
-            1
-            for s in context_signals
-            if (signals.get(s) is not None and (s != "holders" or signals.get(s) > 0))
-        )
-        return known / len(context_signals)
+        # holders is always known (has default 0), so > 0 counts as "known"
+        unknown = signals[_NULLABLE_CONTEXT_SLICE].count(None)
+        known = len(NULLABLE_CONTEXT_FIELDS) - unknown + (signals.holders > 0)
+        return known / CONTEXT_SIGNAL_COUNT
 
     def _log_risk_check(
         self, data: TokenData, safety_score: float, context_score: float
     ) -> None:
-        """Log token data for debugging."""
+        """Log token data for debugging (caller checks the DEBUG level)."""
         liq_str = (
             f"${data.liquidity_usd:,.0f}"
             if data.liquidity_usd is not None
@@ -222,9 +288,14 @@ class RiskService:
             else "N/A"
         )
         logger.debug(
-            f"Calculating risk for {data.symbol}: "
-            f"liquidity={liq_str}, age={age_str}, top10={top10_str}, "
-            f"safety={safety_score:.0%}, context={context_score:.0%}"
+            "Calculating risk for %s: liquidity=%s, age=%s, top10=%s, "
+            "safety=%.0f%%, context=%.0f%%",
+            data.symbol,
+            liq_str,
+            age_str,
+            top10_str,
+            safety_score * 100,
+            context_score * 100,
         )
 
     def _is_high_risk(self, data: TokenData) -> bool:
@@ -244,6 +315,9 @@ class RiskService:
         - age_days < 7
         - liquidity_usd < 20k
 
+        Any trigger decides the result, so checks run cheapest first:
+        flags, then single thresholds, then combined conditions.
+
         Args:
             data: Token data to check
 
@@ -261,63 +335,58 @@ class RiskService:
             logger.debug("HIGH risk: freeze authority exists")
             return True
 
-        if (
-            data.top1_holder_percent is not None
-            and data.top1_holder_percent > t.top1_high_risk
-        ):
-            logger.debug(
-                f"HIGH risk: top1 {data.top1_holder_percent}% > {t.top1_high_risk}%"
-            )
+        # Unknown values can never trigger a rule: map None to an infinity
+        # on the safe side, so each rule is a single plain comparison
+        top1 = data.top1_holder_percent
+        top1 = _NEG_INF if top1 is None else top1
+        top2 = data.top2_holder_percent
+        top2 = _NEG_INF if top2 is None else top2
+        top5 = data.top5_holders_percent
+        top5 = _NEG_INF if top5 is None else top5
+        top10 = data.top10_holders_percent
+        top10 = _NEG_INF if top10 is None else top10
+        liquidity = data.liquidity_usd
+        liquidity = _POS_INF if liquidity is None else liquidity
+        age = data.age_days
+        age = _POS_INF if age is None else age
+
+        if top1 > t.top1_high_risk:
+            logger.debug("HIGH risk: top1 %s%% > %s%%", top1, t.top1_high_risk)
             return True
 
         # top5 > 50% standalone (no combo with age)
-        if (
-            data.top5_holders_percent is not None
-            and data.top5_holders_percent > t.top5_high_risk
-        ):
-            logger.debug(
-                f"HIGH risk: top5 {data.top5_holders_percent}% > {t.top5_high_risk}%"
-            )
+        if top5 > t.top5_high_risk:
+            logger.debug("HIGH risk: top5 %s%% > %s%%", top5, t.top5_high_risk)
             return True
 
-        if (
-            data.top10_holders_percent is not None
-            and data.top10_holders_percent > t.top10_high_risk
-        ):
+        if top10 > t.top10_high_risk:
+            logger.debug("HIGH risk: top10 %s%% > %s%%", top10, t.top10_high_risk)
+            return True
+
+        # Contextual signals — HIGH only if known and dangerous
+        if liquidity < t.liquidity_high_risk:
             logger.debug(
-                f"HIGH risk: top10 {data.top10_holders_percent}% > {t.top10_high_risk}%"
+                "HIGH risk: liquidity %s < %s", liquidity, t.liquidity_high_risk
             )
             return True
 
-        # (top1 + top2) > 40% — two whales control too much
-        if (
-            data.top1_holder_percent is not None
-            and data.top2_holder_percent is not None
-        ):
-            top1_top2_sum = data.top1_holder_percent + data.top2_holder_percent
-            if top1_top2_sum > t.top1_top2_high_risk:
-                logger.debug(
-                    f"HIGH risk: (top1 + top2) = {top1_top2_sum}% > {t.top1_top2_high_risk}%"
-                )
-                return True
-
-        # Full opacity: both age AND liquidity unknown = HIGH
-        if data.age_days is None and data.liquidity_usd is None:
-            logger.debug("HIGH risk: both age and liquidity unknown (full opacity)")
+        if age < t.age_high_risk:
+            logger.debug("HIGH risk: age %s < %s", age, t.age_high_risk)
             return True
 
-        # Contextual signals — HIGH only if known and dangerous
-        if (
-            data.liquidity_usd is not None
-            and data.liquidity_usd < t.liquidity_high_risk
-        ):
+        # (top1 + top2) > 40% — two whales control too much (-inf if unknown)
+        top1_top2_sum = top1 + top2
+        if top1_top2_sum > t.top1_top2_high_risk:
             logger.debug(
-                f"HIGH risk: liquidity {data.liquidity_usd} < {t.liquidity_high_risk}"
+                "HIGH risk: (top1 + top2) = %s%% > %s%%",
+                top1_top2_sum,
+                t.top1_top2_high_risk,
             )
             return True
 
-        if data.age_days is not None and data.age_days < t.age_high_risk:
-            logger.debug(f"HIGH risk: age {data.age_days} < {t.age_high_risk}")
+        # Full opacity: both age AND liquidity unknown = HIGH
+        if data.age_days is None and data.liquidity_usd is None:
+            logger.debug("HIGH risk: both age and liquidity unknown (full opacity)")
             return True
 
         return False
@@ -348,23 +417,15 @@ class RiskService:
         t = self._thresholds
 
         # LOW ЗАПРЕЩЁН если любой критический сигнал = None
-        if data.mint_authority_exists is None:
-            logger.debug("LOW forbidden: mint_authority_exists is None")
-            return False
-        if data.freeze_authority_exists is None:
-            logger.debug("LOW forbidden: freeze_authority_exists is None")
-            return False
-        if data.top1_holder_percent is None:
-            logger.debug("LOW forbidden: top1_holder_percent is None")
-            return False
-        if data.top2_holder_percent is None:
-            logger.debug("LOW forbidden: top2_holder_percent is None")
-            return False
-        if data.top5_holders_percent is None:
-            logger.debug("LOW forbidden: top5_holders_percent is None")
-            return False
-        if data.top10_holders_percent is None:
-            logger.debug("LOW forbidden: top10_holders_percent is None")
+        if None in (
+            data.mint_authority_exists,
+            data.freeze_authority_exists,
+            data.top1_holder_percent,
+            data.top2_holder_percent,
+            data.top5_holders_percent,
+            data.top10_holders_percent,
+        ):
+            logger.debug("LOW forbidden: critical signal is None")
             return False
 
         # LOW ЗАПРЕЩЁН если authority активны
@@ -375,13 +436,25 @@ class RiskService:
 
         # LOW ЗАПРЕЩЁН если концентрация выше строгих порогов
         if data.top1_holder_percent > t.top1_low_risk:
-            logger.debug(f"LOW forbidden: top1 {data.top1_holder_percent}% > {t.top1_low_risk}%")
+            logger.debug(
+                "LOW forbidden: top1 %s%% > %s%%",
+                data.top1_holder_percent,
+                t.top1_low_risk,
+            )
             return False
         if data.top5_holders_percent > t.top5_low_risk:
-            logger.debug(f"LOW forbidden: top5 {data.top5_holders_percent}% > {t.top5_low_risk}%")
+            logger.debug(
+                "LOW forbidden: top5 %s%% > %s%%",
+                data.top5_holders_percent,
+                t.top5_low_risk,
+            )
             return False
         if data.top10_holders_percent > t.top10_low_risk:
-            logger.debug(f"LOW forbidden: top10 {data.top10_holders_percent}% > {t.top10_low_risk}%")
+            logger.debug(
+                "LOW forbidden: top10 %s%% > %s%%",
+                data.top10_holders_percent,
+                t.top10_low_risk,
+            )
             return False
 
         # LOW ЗАПРЕЩЁН если liquidity/age неизвестны или недостаточны
@@ -389,24 +462,38 @@ class RiskService:
             logger.debug("LOW forbidden: liquidity_usd is None")
             return False
         if data.liquidity_usd < t.liquidity_low_risk:
-            logger.debug(f"LOW forbidden: liquidity {data.liquidity_usd} < {t.liquidity_low_risk}")
+            logger.debug(
+                "LOW forbidden: liquidity %s < %s",
+                data.liquidity_usd,
+                t.liquidity_low_risk,
+            )
             return False
 
         if data.age_days is None:
             logger.debug("LOW forbidden: age_days is None")
             return False
         if data.age_days < t.age_low_risk:
-            logger.debug(f"LOW forbidden: age {data.age_days} < {t.age_low_risk}")
+            logger.debug("LOW forbidden: age %s < %s", data.age_days, t.age_low_risk)
             return False
 
         # LOW ЗАПРЕЩЁН если мало холдеров (если известно)
         if data.holders < t.holders_low_risk:
-            logger.debug(f"LOW forbidden: holders {data.holders} < {t.holders_low_risk}")
+            logger.debug(
+                "LOW forbidden: holders %s < %s",
+                data.holders,
+                t.holders_low_risk,
+            )
             return False
 
         return True
 
-    def get_risk_factors(self, data: TokenData) -> list[str]:
+    def get_risk_factors(
+        self,
+        data: TokenData,
+        signals: Signals | None = None,
+        safety_score: float | None = None,
+        context_score: float | None = None,
+    ) -> list[str]:
         """
         Get list of risk factors for a token (v2.2).
 
@@ -418,6 +505,9 @@ class RiskService:
 
         Args:
             data: Token data to analyze
+            signals: Signals already extracted from data (computed if None)
+            safety_score: Precomputed safety completeness (computed if None)
+            context_score: Precomputed context completeness (computed if None)
 
         Returns:
             List of risk factor descriptions in Russian
@@ -425,10 +515,14 @@ class RiskService:
         t = self._thresholds
         factors: list[str] = []
 
-        # Calculate completeness for UX Confidence Gate
-        signals = self._extract_signals(data)
-        safety_score = self._calculate_safety_completeness(signals)
-        context_score = self._calculate_context_completeness(signals)
+        # Calculate completeness for UX Confidence Gate, unless the caller
+        # already has it (calculate_risk computes the same values)
+        if signals is None:
+            signals = self._extract_signals(data)
+        if safety_score is None:
+            safety_score = self._calculate_safety_completeness(signals)
+        if context_score is None:
+            context_score = self._calculate_context_completeness(signals)
         total_completeness = (safety_score * 0.7) + (context_score * 0.3)
 
         # UX Confidence Gate: if total completeness < 50%, warn user
@@ -440,16 +534,11 @@ class RiskService:
             factors.append("Полная непрозрачность: возраст и ликвидность неизвестны")
 
         # Unknown critical signals (for transparency)
-        if data.mint_authority_exists is None:
-            factors.append("Данные о mint authority недоступны")
-        if data.freeze_authority_exists is None:
-            factors.append("Данные о freeze authority недоступны")
-        if data.top1_holder_percent is None:
-            factors.append("Данные о крупнейшем держателе недоступны")
-        if data.top2_holder_percent is None:
-            factors.append("Данные о втором крупнейшем держателе недоступны")
-        if data.top10_holders_percent is None:
-            factors.append("Данные о распределении токенов недоступны")
+        factors.extend(
+            text
+            for key, text in UNKNOWN_SIGNAL_FACTORS
+            if getattr(signals, key) is None
+        )
 
         # Authority factors (critical)
         if data.mint_authority_exists is True:
@@ -538,15 +627,9 @@ class RiskService:
             factors.append("Подозрительная активность кошелька разработчика")
 
         # Social factors (absence is a risk)
-        missing_social = []
-        if not data.social.twitter_exists:
-            missing_social.append("Twitter")
-        if not data.social.telegram_exists:
-            missing_social.append("Telegram")
-        if not data.social.website_valid:
-            missing_social.append("сайт")
-
-        if len(missing_social) >= 2:
-            factors.append(f"Отсутствуют: {', '.join(missing_social)}")
+        missing = ~data.social.flags
+        if missing.bit_count() >= 2:
+            labels = [label for flag, label in SOCIAL_LABELS if flag in missing]
+            factors.append(f"Отсутствуют: {', '.join(labels)}")
 
         return factors
@@ -7,7 +7,7 @@ and normalizing it into a unified TokenData structure.
 This service:
 1. Delegates data fetching to TokenDataProvider
 2. Can combine data from multiple sources (future)
-3. Handles caching (future)
+3. Caches recent results per address
 """
 
 import asyncio
@@ -16,12 +16,18 @@ import logging
 from bot.core.exceptions import DataFetchError
 from bot.core.models import TokenData
 from bot.core.protocols import TokenDataProvider
+from bot.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for provider calls (seconds)
 DEFAULT_TIMEOUT = 10.0
 
+# Token data cache defaults: repeated lookups of a hot address within a
+# minute reuse the previous result instead of calling the provider
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAXSIZE = 5000
+
 
 class TokenDataAggregator:
     """
@@ -35,22 +41,35 @@ class TokenDataAggregator:
     2. Handle errors gracefully
     3. Log operations for debugging
     4. Enforce timeout on provider calls
+    5. Cache results per address for a short TTL (callers get copies)
 
     It does NOT:
     - Calculate risk (that's RiskService's job)
     - Generate explanations (that's ExplainService's job)
     """
 
-    def __init__(self, provider: TokenDataProvider, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        provider: TokenDataProvider,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    ):
         """
         Initialize aggregator with a data provider.
 
         Args:
             provider: TokenDataProvider implementation (mock or real)
             timeout: Timeout for provider calls in seconds
+            cache_ttl: Lifetime of cached token data in seconds (0 disables)
+            cache_maxsize: Maximum number of cached addresses
         """
         self._provider = provider
         self._timeout = timeout
+        # Successfully fetched token data by address (errors not cached)
+        self._cache: TTLCache[str, TokenData] = TTLCache(
+            maxsize=cache_maxsize, ttl=cache_ttl
+        )
 
     async def get_token_data(self, address: str) -> TokenData:
         """
@@ -65,7 +84,18 @@ class TokenDataAggregator:
         Raises:
             DataFetchError: If fetching fails
         """
-        logger.info(f"Fetching token data for: {address[:8]}...")
+        cached = self._cache.get(address)
+        if cached is not None:
+            logger.debug(
+                "Token data cache hit for %s (hits=%d, misses=%d)",
+                address[:8],
+                self._cache.hits,
+                self._cache.misses,
+            )
+            # A copy, so one caller's changes don't leak into later hits
+            return cached.model_copy()
+
+        logger.info("Fetching token data for: %s...", address[:8])
 
         try:
             # Enforce timeout on provider call
@@ -79,13 +109,17 @@ class TokenDataAggregator:
                 else "N/A"
             )
             logger.info(
-                f"Token data received: {token_data.symbol or 'UNKNOWN'}, "
-                f"liquidity={liq_str}"
+                "Token data received: %s, liquidity=%s",
+                token_data.symbol or "UNKNOWN",
+                liq_str,
             )
+            self._cache.set(address, token_data.model_copy())
             return token_data
 
         except TimeoutError:
-            logger.error(f"Provider timeout after {self._timeout}s for {address[:8]}")
+            logger.error(
+                "Provider timeout after %ss for %s", self._timeout, address[:8]
+            )
             raise DataFetchError(
                 message="Запрос занял слишком много времени. Попробуйте позже.",
                 technical_message=f"Provider timeout after {self._timeout}s",
@@ -97,7 +131,7 @@ class TokenDataAggregator:
 
         except Exception as e:
             # Wrap unexpected errors
-            logger.exception(f"Unexpected error fetching token data: {e}")
+            logger.exception("Unexpected error fetching token data: %s", e)
             raise DataFetchError(
                 message="Не удалось получить данные о токене.",
                 technical_message=f"Provider error: {type(e).__name__}: {e}",
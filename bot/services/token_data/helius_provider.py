@@ -42,16 +42,24 @@ class HeliusTokenDataProvider:
     Retry: 1 time on failure
     """
 
-    def __init__(self, api_key: str, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        session: aiohttp.ClientSession | None = None,
+    ):
         """
         Initialize Helius provider.
 
         Args:
             api_key: Helius API key
             timeout: Request timeout in seconds (default 1.2s)
+            session: Shared HTTP session; a short-lived one is opened
+                per request when not given. Not closed by the provider.
         """
         self._api_key = api_key
         self._timeout = timeout
+        self._session = session
         self._base_url = f"{HELIUS_RPC_URL}/?api-key={api_key}"
 
     async def get_token_data(self, address: str) -> TokenData:
@@ -70,38 +78,11 @@ class HeliusTokenDataProvider:
         logger.info(f"Fetching token data from Helius: {address[:8]}...")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Fetch asset metadata and largest accounts in parallel
-                asset_task = self._fetch_asset(session, address)
-                holders_task = self._fetch_largest_accounts(session, address)
-
-                results = await asyncio.gather(
-                    asset_task, holders_task, return_exceptions=True
-                )
+            if self._session is not None:
+                return await self._fetch_token_data(self._session, address)
 
-                asset_result, holders_result = results
-
-                # If ANY result is DataFetchError → API is unavailable, raise it
-                for result in results:
-                    if isinstance(result, DataFetchError):
-                        raise result
-                    if isinstance(result, Exception):
-                        # Unexpected exception → treat as API error
-                        logger.error(f"Unexpected error in API call: {result}")
-                        raise DataFetchError(
-                            message="Ошибка получения данных.",
-                            technical_message=f"Unexpected: {type(result).__name__}: {result}",
-                        )
-
-                # Both None = token doesn't exist (API worked but no data)
-                if asset_result is None and holders_result is None:
-                    raise DataFetchError(
-                        message="Токен не найден. Проверьте адрес.",
-                        technical_message=f"Token {address} not found in Helius",
-                    )
-
-                # At least one succeeded → build TokenData with available data
-                return self._build_token_data(address, asset_result, holders_result)
+            async with aiohttp.ClientSession() as session:
+                return await self._fetch_token_data(session, address)
 
         except DataFetchError:
             raise
@@ -112,6 +93,45 @@ class HeliusTokenDataProvider:
                 technical_message=f"Helius error: {type(e).__name__}: {e}",
             ) from e
 
+    async def _fetch_token_data(
+        self, session: aiohttp.ClientSession, address: str
+    ) -> TokenData:
+        """
+        Fetch asset and holders in parallel and build TokenData.
+
+        Raises:
+            DataFetchError: If API is unavailable or token not found
+        """
+        # Fetch asset metadata and largest accounts in parallel
+        asset_task = self._fetch_asset(session, address)
+        holders_task = self._fetch_largest_accounts(session, address)
+
+        results = await asyncio.gather(asset_task, holders_task, return_exceptions=True)
+
+        asset_result, holders_result = results
+
+        # If ANY result is DataFetchError → API is unavailable, raise it
+        for result in results:
+            if isinstance(result, DataFetchError):
+                raise result
+            if isinstance(result, Exception):
+                # Unexpected exception → treat as API error
+                logger.error(f"Unexpected error in API call: {result}")
+                raise DataFetchError(
+                    message="Ошибка получения данных.",
+                    technical_message=f"Unexpected: {type(result).__name__}: {result}",
+                )
+
+        # Both None = token doesn't exist (API worked but no data)
+        if asset_result is None and holders_result is None:
+            raise DataFetchError(
+                message="Токен не найден. Проверьте адрес.",
+                technical_message=f"Token {address} not found in Helius",
+            )
+
+        # At least one succeeded → build TokenData with available data
+        return self._build_token_data(address, asset_result, holders_result)
+
     async def _fetch_asset(
         self, session: aiohttp.ClientSession, address: str
     ) -> dict | None:
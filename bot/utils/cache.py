@@ -0,0 +1,92 @@
+"""
+In-memory TTL cache.
+
+Small LRU cache with per-entry expiry, used to skip repeated
+external API calls for identical inputs.
+
+All operations are synchronous and never await, so the cache is safe
+to share between coroutines on one event loop without a lock.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU cache whose entries expire after a fixed time-to-live.
+
+    When full, the least recently used entry is evicted.
+    Expired entries are dropped lazily on access.
+    Lookups are counted in `hits` and `misses` for monitoring.
+
+    Usage:
+        cache: TTLCache[str, int] = TTLCache(maxsize=1000, ttl=60)
+        cache.set("key", 1)
+        value = cache.get("key")  # 1, or None once expired
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Entry lifetime in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
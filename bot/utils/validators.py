@@ -2,7 +2,8 @@
 Solana address validation.
 
 Validates that a string is a valid Solana public key address.
-Uses actual base58 decoding instead of regex for accuracy.
+A precompiled base58 alphabet pattern rejects malformed input cheaply,
+then actual base58 decoding verifies the 32-byte key length.
 
 Solana addresses:
 - Use base58 encoding (no 0, O, I, l characters)
@@ -10,8 +11,13 @@ Solana addresses:
 - Typically 32-44 characters when encoded
 """
 
+import re
+
 import base58
 
+# Base58 alphabet (Bitcoin/Solana): no 0, O, I, l
+_BASE58_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]+")
+
 
 def validate_solana_address(address: str) -> tuple[bool, str | None]:
     """
@@ -54,6 +60,10 @@ def validate_solana_address(address: str) -> tuple[bool, str | None]:
             f"Неверная длина адреса: {len(address)} символов (ожидается 32-44)",
         )
 
+    # Reject non-base58 characters before decoding
+    if _BASE58_RE.fullmatch(address) is None:
+        return False, "Невалидный формат base58"
+
     # Try to decode base58
     try:
         decoded = base58.b58decode(address)
@@ -0,0 +1,76 @@
+"""
+Tests for TokenDataAggregator.
+
+Tests cover:
+- Caching of token data per address
+- Isolation of cached data from caller changes
+- Disabled cache (zero TTL)
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bot.core.models import TokenData
+from bot.services.token_data.aggregator import TokenDataAggregator
+
+
+@pytest.fixture
+def counting_provider(high_risk_token: TokenData) -> AsyncMock:
+    """Provider stub that records calls and returns a fixed token."""
+    provider = AsyncMock()
+    provider.get_token_data.return_value = high_risk_token
+    return provider
+
+
+class TestAggregatorCache:
+    """Tests for per-address token data caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_address_served_from_cache(
+        self,
+        counting_provider: AsyncMock,
+        valid_solana_address: str,
+    ) -> None:
+        """Second lookup of the same address should not call the provider."""
+        aggregator = TokenDataAggregator(counting_provider)
+
+        first = await aggregator.get_token_data(valid_solana_address)
+        second = await aggregator.get_token_data(valid_solana_address)
+
+        assert first == second
+        assert counting_provider.get_token_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_caller_changes_do_not_leak_into_cache(
+        self,
+        counting_provider: AsyncMock,
+        valid_solana_address: str,
+    ) -> None:
+        """Changing returned data should not affect later cache hits."""
+        aggregator = TokenDataAggregator(counting_provider)
+
+        first = await aggregator.get_token_data(valid_solana_address)
+        original_holders = first.holders
+        first.holders = -1
+        second = await aggregator.get_token_data(valid_solana_address)
+        second.symbol = "CHANGED"
+        third = await aggregator.get_token_data(valid_solana_address)
+
+        assert third.holders == original_holders
+        assert third.symbol != "CHANGED"
+        assert counting_provider.get_token_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(
+        self,
+        counting_provider: AsyncMock,
+        valid_solana_address: str,
+    ) -> None:
+        """With zero TTL every lookup should reach the provider."""
+        aggregator = TokenDataAggregator(counting_provider, cache_ttl=0)
+
+        await aggregator.get_token_data(valid_solana_address)
+        await aggregator.get_token_data(valid_solana_address)
+
+        assert counting_provider.get_token_data.await_count == 2
@@ -0,0 +1,65 @@
+"""
+Tests for TTLCache.
+
+Tests cover:
+- Get/set round trip
+- Expiry after TTL
+- LRU eviction when full
+- Hit/miss counters
+"""
+
+from unittest.mock import patch
+
+from bot.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_stored_value(self) -> None:
+        """Should return value stored under key."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+
+    def test_missing_key_returns_none(self) -> None:
+        """Should return None for unknown key."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+
+        assert cache.get("missing") is None
+
+    def test_expired_entry_returns_none(self) -> None:
+        """Should drop entries older than TTL."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+
+        with patch("bot.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("bot.utils.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Should evict least recently used entry when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_counts_hits_and_misses(self) -> None:
+        """Should count lookups that found a value and those that did not."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.hits == 2
+        assert cache.misses == 1
@@ -0,0 +1,147 @@
+"""
+Tests for ExplainService and the explanation policy.
+
+Tests cover:
+- Deterministic verdict detection
+- Canned answers without an LLM call
+- LLM call for verdicts that need explaining
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bot.core.models import (
+    AnalysisResult,
+    Recommendation,
+    RiskLevel,
+    RiskResult,
+    TokenData,
+)
+from bot.services.explain.policy import is_deterministic
+from bot.services.explain.service import ExplainService
+from bot.services.risk.service import RiskService
+
+
+@pytest.fixture
+def llm_provider() -> AsyncMock:
+    """Provider stub that records calls and returns a fixed answer."""
+    provider = AsyncMock()
+    provider.generate_analysis.return_value = AnalysisResult(
+        risk=RiskLevel.MEDIUM,
+        summary="LLM answer",
+        why=["LLM reason"],
+        recommendation=Recommendation.CAUTION,
+    )
+    return provider
+
+
+class TestDeterministicPolicy:
+    """Tests for is_deterministic on calculated results."""
+
+    def test_complete_low_risk_is_deterministic(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """LOW risk with near-complete data should not need the LLM."""
+        low_risk_token.metadata_mutable = False
+        result = risk_service.calculate_risk(low_risk_token)
+        assert result.level == RiskLevel.LOW
+        assert is_deterministic(result)
+
+    def test_low_risk_with_warning_factors_is_not_deterministic(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """LOW risk with complete data but a warning should go to the LLM."""
+        low_risk_token.metadata_mutable = True
+        result = risk_service.calculate_risk(low_risk_token)
+        assert result.level == RiskLevel.LOW
+        assert "Метаданные токена могут быть изменены" in result.factors
+        assert not is_deterministic(result)
+
+    def test_safelist_token_is_deterministic(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """SafeList protocol tokens should get the canned answer."""
+        low_risk_token.address = "So11111111111111111111111111111111111111112"
+        result = risk_service.calculate_risk(low_risk_token)
+        assert is_deterministic(result)
+
+    def test_medium_risk_is_not_deterministic(
+        self,
+        risk_service: RiskService,
+        medium_risk_token: TokenData,
+    ) -> None:
+        """MEDIUM risk with known signals should still be explained by the LLM."""
+        result = risk_service.calculate_risk(medium_risk_token)
+        assert not is_deterministic(result)
+
+
+class TestExplainServiceShortCircuit:
+    """Tests for answering deterministic verdicts without the provider."""
+
+    @pytest.mark.asyncio
+    async def test_skips_provider_when_no_signals_known(
+        self,
+        llm_provider: AsyncMock,
+        medium_risk_token: TokenData,
+    ) -> None:
+        """Should answer from the template without calling the provider."""
+        risk_result = RiskResult(
+            level=RiskLevel.MEDIUM,
+            factors=["Данные о mint authority недоступны"],
+            safety_completeness=0.0,
+            context_completeness=0.0,
+            risk_signals={},
+        )
+
+        result = await ExplainService(llm_provider).explain(
+            medium_risk_token, risk_result
+        )
+
+        llm_provider.generate_analysis.assert_not_awaited()
+        assert result.risk == RiskLevel.MEDIUM
+        assert result.why == ["Данные о mint authority недоступны"]
+
+    @pytest.mark.asyncio
+    async def test_skips_provider_for_complete_low_risk(
+        self,
+        llm_provider: AsyncMock,
+        low_risk_token: TokenData,
+    ) -> None:
+        """Should answer LOW risk with full data from the template."""
+        risk_result = RiskResult(
+            level=RiskLevel.LOW,
+            factors=[],
+            safety_completeness=1.0,
+            context_completeness=1.0,
+            risk_signals={},
+        )
+
+        result = await ExplainService(llm_provider).explain(low_risk_token, risk_result)
+
+        llm_provider.generate_analysis.assert_not_awaited()
+        assert result.risk == RiskLevel.LOW
+        assert result.recommendation == Recommendation.OK
+
+    @pytest.mark.asyncio
+    async def test_calls_provider_for_medium_risk(
+        self,
+        llm_provider: AsyncMock,
+        risk_service: RiskService,
+        medium_risk_token: TokenData,
+    ) -> None:
+        """Verdicts that need explaining should go to the provider."""
+        risk_result = risk_service.calculate_risk(medium_risk_token)
+
+        result = await ExplainService(llm_provider).explain(
+            medium_risk_token, risk_result
+        )
+
+        llm_provider.generate_analysis.assert_awaited_once()
+        assert result.summary == "LLM answer"
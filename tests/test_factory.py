@@ -0,0 +1,135 @@
+"""
+Tests for ServiceFactory.
+
+Tests cover:
+- Reuse of created services and the shared HTTP session
+- Closing the shared session exactly once
+- Warmup tolerating network errors
+"""
+
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from bot.config.settings import Settings
+from bot.services.explain.openrouter_provider import OPENROUTER_API_URL
+from bot.services.factory import ServiceFactory
+from bot.services.token_data.helius_provider import HELIUS_RPC_URL
+
+
+def make_settings(**overrides: object) -> Settings:
+    """Production-mode settings that ignore the local .env file."""
+    values: dict[str, object] = {
+        "telegram_bot_token": "123:test",
+        "use_mock_services": False,
+        "helius_api_key": "test-helius-key",
+        "openrouter_api_key": "test-openrouter-key",
+    }
+    values.update(overrides)
+    return Settings(_env_file=None, **values)
+
+
+@pytest.fixture
+async def factory() -> AsyncIterator[ServiceFactory]:
+    """Production-mode factory, closed after the test."""
+    factory = ServiceFactory(make_settings())
+    yield factory
+    await factory.close()
+
+
+class TestServiceFactoryReuse:
+    """Tests for caching of created services."""
+
+    @pytest.mark.asyncio
+    async def test_services_are_created_once(self, factory: ServiceFactory) -> None:
+        """Repeated create_* calls should return the same instances."""
+        orchestrator = factory.create_orchestrator()
+
+        assert factory.create_orchestrator() is orchestrator
+        assert factory.create_llm_provider() is factory.create_llm_provider()
+        assert (
+            factory.create_token_data_provider() is factory.create_token_data_provider()
+        )
+
+    @pytest.mark.asyncio
+    async def test_real_providers_share_one_session(
+        self, factory: ServiceFactory
+    ) -> None:
+        """Both real providers should use the factory's session."""
+        factory.create_orchestrator()
+        session = factory._get_http_session()
+
+        assert factory.create_llm_provider()._session is session
+        assert factory.create_token_data_provider()._session is session
+
+    def test_mock_mode_opens_no_session(self) -> None:
+        """Mock providers should not make the factory open a session."""
+        factory = ServiceFactory(make_settings(use_mock_services=True))
+        factory.create_orchestrator()
+
+        assert factory._http_session is None
+
+
+class TestServiceFactoryClose:
+    """Tests for releasing the shared HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_close_closes_session_once(
+        self,
+        factory: ServiceFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Closing twice should close the owned session only once."""
+        session = factory._get_http_session()
+        close = AsyncMock(wraps=session.close)
+        monkeypatch.setattr(session, "close", close)
+
+        await factory.close()
+        await factory.close()
+
+        close.assert_awaited_once()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_injected_session_is_not_closed(self) -> None:
+        """A caller-owned session should be left open."""
+        async with aiohttp.ClientSession() as session:
+            factory = ServiceFactory(make_settings(), http_session=session)
+            factory.create_orchestrator()
+
+            await factory.close()
+
+            assert not session.closed
+
+
+class TestServiceFactoryWarmup:
+    """Tests for connection warmup."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_swallows_network_errors(
+        self,
+        factory: ServiceFactory,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Failed warmup requests should be logged, not raised."""
+        with aioresponses() as m:
+            m.head(HELIUS_RPC_URL, exception=aiohttp.ClientConnectionError())
+            m.head(OPENROUTER_API_URL, exception=TimeoutError())
+
+            await factory.warmup()
+
+        assert caplog.text.count("Warmup request to") == 2
+
+    @pytest.mark.asyncio
+    async def test_warmup_is_noop_in_mock_mode(self) -> None:
+        """Mock mode should not open a session or send requests."""
+        factory = ServiceFactory(make_settings(use_mock_services=True))
+
+        with aioresponses() as m:
+            await factory.warmup()
+
+            assert not m.requests
+        assert factory._http_session is None
@@ -8,6 +8,7 @@ Tests cover:
 - Holder concentration calculation
 """
 
+import aiohttp
 import pytest
 from aioresponses import aioresponses
 
@@ -121,6 +122,29 @@ class TestHeliusProviderSuccess:
             assert result.freeze_authority_exists is False
             assert result.metadata_mutable is False
 
+    @pytest.mark.asyncio
+    async def test_uses_shared_session_without_closing_it(
+        self,
+        mock_asset_response: dict,
+        mock_holders_response: dict,
+    ) -> None:
+        """Should reuse an injected session and leave it open."""
+        async with aiohttp.ClientSession() as session:
+            provider = HeliusTokenDataProvider(
+                api_key="test-api-key", timeout=1.0, session=session
+            )
+            with aioresponses() as m:
+                url = f"{HELIUS_RPC_URL}/?api-key=test-api-key"
+                m.post(url, payload=mock_asset_response)
+                m.post(url, payload=mock_holders_response)
+
+                result = await provider.get_token_data(
+                    "TestToken11111111111111111111111111111111"
+                )
+
+            assert result.symbol == "TEST"
+            assert not session.closed
+
     @pytest.mark.asyncio
     async def test_detects_authorities(
         self,
@@ -0,0 +1,85 @@
+"""
+Tests for the bot entry point.
+
+Tests cover:
+- Webhook server stops on SIGTERM and cleans up
+- Cleanup still runs when removing the webhook fails
+"""
+
+import os
+import signal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram import Dispatcher
+
+from bot.main import run_webhook
+
+
+@pytest.fixture
+def webhook_settings() -> SimpleNamespace:
+    """Webhook settings bound to a free local port."""
+    return SimpleNamespace(
+        webhook_url="https://example.com/webhook",
+        webhook_path="/webhook",
+        webhook_secret="",
+        webhook_host="127.0.0.1",
+        webhook_port=0,
+    )
+
+
+@pytest.fixture
+def signalling_bot() -> AsyncMock:
+    """Bot stub that sends SIGTERM to the process once the webhook is set."""
+    bot = AsyncMock()
+    bot.set_webhook.side_effect = lambda *a, **kw: os.kill(os.getpid(), signal.SIGTERM)
+    return bot
+
+
+@pytest.fixture
+def dispatcher() -> tuple[Dispatcher, list[str]]:
+    """Dispatcher whose shutdown handler records that it ran."""
+    dp = Dispatcher()
+    calls: list[str] = []
+
+    async def on_shutdown() -> None:
+        calls.append("shutdown")
+
+    dp.shutdown.register(on_shutdown)
+    return dp, calls
+
+
+class TestRunWebhook:
+    """Tests for webhook mode lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_sigterm_stops_and_cleans_up(
+        self,
+        signalling_bot: AsyncMock,
+        dispatcher: tuple[Dispatcher, list[str]],
+        webhook_settings: SimpleNamespace,
+    ) -> None:
+        """SIGTERM should remove the webhook and run the shutdown handlers."""
+        dp, calls = dispatcher
+
+        await run_webhook(dp, signalling_bot, webhook_settings)
+
+        signalling_bot.delete_webhook.assert_awaited_once()
+        assert calls == ["shutdown"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_when_delete_webhook_fails(
+        self,
+        signalling_bot: AsyncMock,
+        dispatcher: tuple[Dispatcher, list[str]],
+        webhook_settings: SimpleNamespace,
+    ) -> None:
+        """A failed webhook removal should not skip the shutdown handlers."""
+        dp, calls = dispatcher
+        signalling_bot.delete_webhook.side_effect = OSError("network down")
+
+        with pytest.raises(OSError):
+            await run_webhook(dp, signalling_bot, webhook_settings)
+
+        assert calls == ["shutdown"]
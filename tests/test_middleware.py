@@ -1,19 +1,22 @@
 """
 Tests for middleware components.
 
-Tests error handling and logging middleware behavior.
+Tests error handling, logging and concurrency middleware behavior.
 Uses mock objects to simulate aiogram updates.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiogram.types import Message
 
 from bot.core.exceptions import (
     DataFetchError,
     LLMError,
     ValidationError,
 )
+from bot.middleware.concurrency import ConcurrencyLimitMiddleware
 from bot.middleware.error_handler import ErrorHandlerMiddleware
 from bot.middleware.logging import LoggingMiddleware
 
@@ -128,6 +131,35 @@ class TestErrorHandlerMiddleware:
         call_args = mock_update.message.answer.call_args
         assert custom_message in call_args[0][0]
 
+    def test_subclass_inherits_base_policy(
+        self,
+        middleware: ErrorHandlerMiddleware,
+    ) -> None:
+        """Should resolve (and remember) the nearest listed base's policy."""
+
+        class HeliusError(DataFetchError):
+            pass
+
+        policy = middleware._policy_for(HeliusError)
+
+        assert policy == middleware._POLICY[DataFetchError]
+        assert middleware._policy_cache[HeliusError] == policy
+
+    @pytest.mark.asyncio
+    async def test_replies_to_message_event(
+        self,
+        middleware: ErrorHandlerMiddleware,
+    ) -> None:
+        """Should reply directly when installed on a message observer."""
+        message = MagicMock(spec=Message)
+        message.answer = AsyncMock()
+        handler = AsyncMock(side_effect=DataFetchError("API down"))
+
+        result = await middleware(handler, message, {})
+
+        assert result is None
+        message.answer.assert_called_once()
+
 
 class TestLoggingMiddleware:
     """Tests for LoggingMiddleware."""
@@ -197,5 +229,37 @@ class TestLoggingMiddleware:
         await middleware(handler, mock_update, {})
 
         # Check truncation happened
-        info = middleware._get_message_info(mock_update)
+        info = middleware._extract(mock_update).payload
         assert len(info) < len(long_text) + 20  # Some overhead for formatting
+
+
+class TestConcurrencyLimitMiddleware:
+    """Tests for ConcurrencyLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_passes_through_result(self) -> None:
+        """Should pass through handler result."""
+        middleware = ConcurrencyLimitMiddleware(limit=2)
+        handler = AsyncMock(return_value="result")
+
+        result = await middleware(handler, MockUpdate(), {})
+
+        assert result == "result"
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_updates(self) -> None:
+        """Should never run more handlers at once than the limit."""
+        middleware = ConcurrencyLimitMiddleware(limit=2)
+        running = 0
+        peak = 0
+
+        async def handler(event: MockUpdate, data: dict) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(middleware(handler, MockUpdate(), {}) for _ in range(5)))
+
+        assert peak == 2
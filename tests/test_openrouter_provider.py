@@ -8,8 +8,14 @@ Tests cover:
 - Anti-Hallucination Contract compliance
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+
+import aiohttp
+import orjson
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
 
 from bot.core.models import (
     AnalysisResult,
@@ -27,13 +33,15 @@ from bot.services.explain.openrouter_provider import (
 
 
 @pytest.fixture
-def openrouter_provider() -> OpenRouterLLMProvider:
+async def openrouter_provider() -> AsyncIterator[OpenRouterLLMProvider]:
     """OpenRouterLLMProvider with test API key."""
-    return OpenRouterLLMProvider(
+    provider = OpenRouterLLMProvider(
         api_key="test-api-key",
         model="anthropic/claude-3.5-sonnet",
         timeout=1.0,
     )
+    yield provider
+    await provider.aclose()
 
 
 @pytest.fixture
@@ -174,6 +182,75 @@ class TestOpenRouterSuccess:
             assert result.recommendation == Recommendation.CAUTION
             assert len(result.why) >= 1
 
+    @pytest.mark.asyncio
+    async def test_caches_successful_response(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+        mock_success_response: dict,
+    ) -> None:
+        """Should answer a repeated request from cache without calling the API."""
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, payload=mock_success_response)
+
+            first = await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+            second = await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+
+            assert second == first
+            requests = m.requests[("POST", URL(OPENROUTER_API_URL))]
+            assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_marks_system_prompt_for_caching(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+        mock_success_response: dict,
+    ) -> None:
+        """Should send the system prompt as a cache_control content block."""
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, payload=mock_success_response)
+
+            await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+
+            request = m.requests[("POST", URL(OPENROUTER_API_URL))][0]
+            body = orjson.loads(request.kwargs["data"])
+            system_block = body["messages"][0]["content"][0]
+            assert system_block["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_identical_requests(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+        mock_success_response: dict,
+    ) -> None:
+        """Should send one API request for identical concurrent analyses."""
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, payload=mock_success_response)
+
+            results = await asyncio.gather(
+                *(
+                    openrouter_provider.generate_analysis(
+                        sample_token, sample_risk_result_medium
+                    )
+                    for _ in range(3)
+                )
+            )
+
+            assert results[0] == results[1] == results[2]
+            requests = m.requests[("POST", URL(OPENROUTER_API_URL))]
+            assert len(requests) == 1
+
     @pytest.mark.asyncio
     async def test_parses_high_risk_response(
         self,
@@ -266,6 +343,38 @@ class TestOpenRouterJsonParsing:
 
             assert result.risk == RiskLevel.MEDIUM
 
+    @pytest.mark.asyncio
+    async def test_handles_text_around_json(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+    ) -> None:
+        """Should extract JSON object surrounded by prose."""
+        response = {
+            "choices": [
+                {
+                    "message": {
+                        "content": (
+                            "Вот анализ: "
+                            '{"risk": "medium", "summary": "Средний риск.", '
+                            '"why": ["Причина"], "recommendation": "caution"}'
+                            " Надеюсь, это поможет."
+                        )
+                    }
+                }
+            ]
+        }
+
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, payload=response)
+
+            result = await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+
+            assert result.summary == "Средний риск."
+
 
 class TestOpenRouterFallback:
     """Tests for fallback behavior."""
@@ -289,6 +398,100 @@ class TestOpenRouterFallback:
             assert isinstance(result, AnalysisResult)
             assert result.risk == RiskLevel.MEDIUM
 
+    @pytest.mark.asyncio
+    async def test_fallback_is_not_cached(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+        mock_success_response: dict,
+    ) -> None:
+        """Should retry the API after a fallback instead of reusing it."""
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, status=500)
+            m.post(OPENROUTER_API_URL, payload=mock_success_response)
+
+            await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+            await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+
+            requests = m.requests[("POST", URL(OPENROUTER_API_URL))]
+            assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_timeout(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+    ) -> None:
+        """Should use fallback when the request times out."""
+        with aioresponses() as m:
+            m.post(OPENROUTER_API_URL, exception=TimeoutError())
+
+            result = await openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+
+            assert result.risk == RiskLevel.MEDIUM
+            assert result.why == list(sample_risk_result_medium.factors[:5])
+
+    @pytest.mark.asyncio
+    async def test_semaphore_wait_counts_against_timeout(
+        self,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+    ) -> None:
+        """Should fall back when no request slot frees up in time."""
+        provider = OpenRouterLLMProvider(
+            api_key="test-api-key", timeout=0.05, max_concurrency=1
+        )
+        try:
+            async with provider._semaphore:  # hold the only slot
+                with aioresponses() as m:
+                    result = await provider.generate_analysis(
+                        sample_token, sample_risk_result_medium
+                    )
+                    assert not m.requests
+
+            assert result.risk == RiskLevel.MEDIUM
+        finally:
+            await provider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_orphaned_request_failure_is_retrieved(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+        sample_token: TokenData,
+        sample_risk_result_medium: RiskResult,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failure after every waiter left should be logged and forgotten."""
+
+        async def failing_fetch(*_: object) -> AnalysisResult:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(openrouter_provider, "_fetch_analysis", failing_fetch)
+
+        caller = asyncio.create_task(
+            openrouter_provider.generate_analysis(
+                sample_token, sample_risk_result_medium
+            )
+        )
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.05)
+
+        assert not openrouter_provider._inflight
+        assert "In-flight LLM request failed" in caplog.text
+
     @pytest.mark.asyncio
     async def test_fallback_on_invalid_json(
         self,
@@ -436,3 +639,30 @@ class TestOpenRouterValidation:
 
             # Should map to AVOID for HIGH risk
             assert result.recommendation == Recommendation.AVOID
+
+
+class TestOpenRouterSession:
+    """Tests for HTTP session reuse and cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_owned_session_and_closes_it(
+        self,
+        openrouter_provider: OpenRouterLLMProvider,
+    ) -> None:
+        """Should create one session lazily and close it in aclose()."""
+        session = await openrouter_provider._get_session()
+
+        assert await openrouter_provider._get_session() is session
+
+        await openrouter_provider.aclose()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_does_not_close_injected_session(self) -> None:
+        """Should leave a caller-provided session open."""
+        async with aiohttp.ClientSession() as session:
+            provider = OpenRouterLLMProvider(api_key="test-api-key", session=session)
+
+            await provider.aclose()
+
+            assert not session.closed
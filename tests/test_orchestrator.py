@@ -6,12 +6,21 @@ Integration tests that verify the full analysis flow:
 - Risk calculation
 - Explanation generation
 - Result structure
+- Coalescing of concurrent duplicate requests
 """
 
+import asyncio
+import gc
+from unittest.mock import AsyncMock
+
 import pytest
 
-from bot.core.models import AnalysisResult, Recommendation, RiskLevel
+from bot.core.exceptions import DataFetchError
+from bot.core.models import AnalysisResult, Recommendation, RiskLevel, TokenData
+from bot.services.explain.service import ExplainService
 from bot.services.orchestrator import AnalyzerOrchestrator
+from bot.services.risk.service import RiskService
+from bot.services.token_data.aggregator import TokenDataAggregator
 
 
 class TestOrchestratorAnalysis:
@@ -107,6 +116,95 @@ class TestOrchestratorConsistency:
         assert isinstance(result1, AnalysisResult)
         assert isinstance(result2, AnalysisResult)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_same_address_runs_once(
+        self,
+        high_risk_token: TokenData,
+        risk_service: RiskService,
+        explain_service: ExplainService,
+        valid_solana_address: str,
+    ) -> None:
+        """Concurrent analyses of one address should share a single run."""
+        provider = AsyncMock()
+        provider.get_token_data.return_value = high_risk_token
+        orchestrator = AnalyzerOrchestrator(
+            aggregator=TokenDataAggregator(provider, cache_ttl=0),
+            risk_service=risk_service,
+            explain_service=explain_service,
+        )
+
+        results = await asyncio.gather(
+            *(orchestrator.analyze(valid_solana_address) for _ in range(3))
+        )
+
+        assert results[0] is results[1] is results[2]
+        assert provider.get_token_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_orphaned_analysis_failure_is_retrieved(
+        self,
+        risk_service: RiskService,
+        explain_service: ExplainService,
+        valid_solana_address: str,
+    ) -> None:
+        """A failure after every waiter left should not go unretrieved."""
+
+        async def fail(_: str) -> None:
+            await asyncio.sleep(0.01)
+            raise DataFetchError(technical_message="boom")
+
+        provider = AsyncMock()
+        provider.get_token_data.side_effect = fail
+        orchestrator = AnalyzerOrchestrator(
+            aggregator=TokenDataAggregator(provider),
+            risk_service=risk_service,
+            explain_service=explain_service,
+        )
+        loop = asyncio.get_running_loop()
+        errors: list[dict] = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            caller = asyncio.create_task(orchestrator.analyze(valid_solana_address))
+            await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.sleep(0.05)
+            del caller
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert not orchestrator._inflight
+        assert not errors
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_stuck_analysis(
+        self,
+        risk_service: RiskService,
+        explain_service: ExplainService,
+        valid_solana_address: str,
+    ) -> None:
+        """Shutdown should cancel analyses still running after the grace period."""
+
+        async def hang(_: str) -> None:
+            await asyncio.sleep(60)
+
+        provider = AsyncMock()
+        provider.get_token_data.side_effect = hang
+        orchestrator = AnalyzerOrchestrator(
+            aggregator=TokenDataAggregator(provider),
+            risk_service=risk_service,
+            explain_service=explain_service,
+        )
+
+        caller = asyncio.create_task(orchestrator.analyze(valid_solana_address))
+        await asyncio.sleep(0)
+        await orchestrator.shutdown(graceful_timeout=0.01)
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
 
 class TestOrchestratorResultFormat:
     """Tests for result format compliance."""
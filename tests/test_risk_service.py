@@ -11,8 +11,15 @@ Tests cover:
 - SafeList protocol tokens
 """
 
-from bot.core.models import RiskLevel, TokenData
-from bot.services.risk.service import RiskService
+import pytest
+
+from bot.core.models import RiskLevel, SocialInfo, TokenData
+from bot.services.risk.service import (
+    CONTEXT_SIGNAL_FIELDS,
+    CRITICAL_SIGNAL_FIELDS,
+    RiskService,
+    Signals,
+)
 
 
 class TestRiskServiceHighRisk:
@@ -229,6 +236,42 @@ class TestRiskServiceSafeList:
         assert result.level == RiskLevel.LOW
         assert "safelist" in result.risk_signals
 
+    def test_shared_result_cannot_be_mutated(
+        self,
+        risk_service: RiskService,
+    ) -> None:
+        """Shared SafeList result should reject changes to its containers."""
+        token = TokenData(
+            address="So11111111111111111111111111111111111111112",
+            name="Wrapped SOL",
+            symbol="SOL",
+            holders=0,
+            tx_count_24h=0,
+        )
+        result = risk_service.calculate_risk(token)
+
+        with pytest.raises(AttributeError):
+            result.factors.append("injected")  # type: ignore[attr-defined]
+        with pytest.raises(TypeError):
+            result.risk_signals["safelist"] = False  # type: ignore[index]
+
+        assert risk_service.calculate_risk(token).factors == (
+            "Базовый протокольный токен Solana",
+        )
+
+    def test_results_are_hashable(
+        self,
+        risk_service: RiskService,
+        medium_risk_token: TokenData,
+    ) -> None:
+        """Frozen results should hash by content, like they compare."""
+        first = risk_service.calculate_risk(medium_risk_token)
+        second = risk_service.calculate_risk(medium_risk_token)
+
+        assert first is not second
+        assert first == second
+        assert hash(first) == hash(second)
+
     def test_usdc_is_low_risk(
         self,
         risk_service: RiskService,
@@ -330,6 +373,38 @@ class TestRiskServiceCustomThresholds:
 class TestRiskServiceCompleteness:
     """Tests for data completeness scores."""
 
+    def test_signal_groups_match_signals_layout(self) -> None:
+        """Completeness slices Signals by group, so the layout must match."""
+        assert Signals._fields == CRITICAL_SIGNAL_FIELDS + CONTEXT_SIGNAL_FIELDS
+
+    def test_model_copy_recomputes_total_completeness(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """A copy with updated scores should not report the cached total."""
+        result = risk_service.calculate_risk(low_risk_token)
+        original_total = result.total_completeness
+
+        copied = result.model_copy(update={"safety_completeness": 0.0})
+
+        assert copied.total_completeness == result.context_completeness * 0.3
+        assert result.total_completeness == original_total
+
+    def test_context_completeness_counts_each_signal(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """Each unknown context signal should lower the score by one share."""
+        low_risk_token.metadata_mutable = False
+        assert risk_service.calculate_risk(low_risk_token).context_completeness == 1.0
+
+        low_risk_token.age_days = None
+        low_risk_token.holders = 0
+        result = risk_service.calculate_risk(low_risk_token)
+        assert result.context_completeness == 0.5
+
     def test_all_known_safety_completeness(
         self,
         risk_service: RiskService,
@@ -534,3 +609,23 @@ class TestRiskServiceFactors:
         low_risk_token.metadata_mutable = True
         factors = risk_service.get_risk_factors(low_risk_token)
         assert any("метаданные" in f.lower() for f in factors)
+
+    def test_detects_missing_social_factor(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """Should list missing social channels when two or more are absent."""
+        low_risk_token.social = SocialInfo(telegram_exists=True)
+        factors = risk_service.get_risk_factors(low_risk_token)
+        assert "Отсутствуют: Twitter, сайт" in factors
+
+    def test_single_missing_social_is_not_a_factor(
+        self,
+        risk_service: RiskService,
+        low_risk_token: TokenData,
+    ) -> None:
+        """A single missing social channel should not be reported."""
+        low_risk_token.social = SocialInfo(twitter_exists=True, telegram_exists=True)
+        factors = risk_service.get_risk_factors(low_risk_token)
+        assert not any(f.startswith("Отсутствуют") for f in factors)